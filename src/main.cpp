@@ -8,30 +8,57 @@
 #include <sstream>
 #include <cstdlib>
 #include <cstdio>
+#include <cstdint>
 #include <optional>
+#include <vector>
+#include <csignal>
+#include <cerrno>
+#include <cstring>
+#include <sys/socket.h>
+#include <sys/stat.h>
+#include <sys/un.h>
+#include <unistd.h>
 
 // Exit codes
 constexpr int EXIT_SUCCESS_CODE = 0;
 constexpr int EXIT_PARSE_ERROR = 2;
 constexpr int EXIT_INTERNAL_ERROR = 3;
 
-void print_usage(const char* prog) {
-    std::cerr << "Usage: " << prog << " --dumps [--xml] [--max-length N] [--input FILE] [--output FILE]\n";
-    std::cerr << "       " << prog << " --loads [--xml] [--input FILE] [--output FILE]\n";
-    std::cerr << "\n";
-    std::cerr << "Options:\n";
-    std::cerr << "  --dumps          Convert JSON (stdin) to SISL (stdout)\n";
-    std::cerr << "  --loads          Convert SISL (stdin) to JSON (stdout)\n";
-    std::cerr << "  --xml            Use XML instead of JSON as the alternate format\n";
-    std::cerr << "  --max-length N   Split output into parts <= N bytes\n";
-    std::cerr << "  --input FILE     Read input from FILE instead of stdin\n";
-    std::cerr << "  --output FILE    Write output to FILE instead of stdout\n";
+struct Options {
+    bool do_dumps_mode = false;
+    bool do_loads_mode = false;
+    bool xml_mode = false;
+    bool repl_mode = false;
+    bool parts_mode = false;     // --loads input is length-prefixed fragments (--repl only)
+    bool stdout_newline = true;  // End JSON/SISL output on stdout with a newline
+    std::optional<size_t> max_length;
+    std::string input_file;
+    std::string output_file;
+    std::string server_path;
+};
+
+void print_usage(const char* prog, std::ostream& err) {
+    err << "Usage: " << prog << " --dumps [--xml] [--max-length N] [--input FILE] [--output FILE]\n";
+    err << "       " << prog << " --loads [--xml] [--input FILE] [--output FILE]\n";
+    err << "       " << prog << " --repl\n";
+    err << "       " << prog << " --server SOCKET\n";
+    err << "\n";
+    err << "Options:\n";
+    err << "  --dumps          Convert JSON (stdin) to SISL (stdout)\n";
+    err << "  --loads          Convert SISL (stdin) to JSON (stdout)\n";
+    err << "  --xml            Use XML instead of JSON as the alternate format\n";
+    err << "  --max-length N   Split output into parts <= N bytes\n";
+    err << "  --input FILE     Read input from FILE instead of stdin\n";
+    err << "  --output FILE    Write output to FILE instead of stdout\n";
+    err << "  --repl           Serve framed requests on stdin until EOF\n";
+    err << "  --parts          (--repl requests) Input is length-prefixed SISL fragments\n";
+    err << "  --server SOCKET  Serve --repl connections on a Unix domain socket\n";
 }
 
-std::string read_input(const std::string& input_file) {
+std::string read_input(const std::string& input_file, std::istream& in) {
     std::ostringstream ss;
     if (input_file.empty()) {
-        ss << std::cin.rdbuf();
+        ss << in.rdbuf();
     } else {
         std::ifstream ifs(input_file);
         if (!ifs) {
@@ -42,13 +69,48 @@ std::string read_input(const std::string& input_file) {
     return ss.str();
 }
 
-int do_dumps(const std::string& input, std::optional<size_t> max_length, bool xml_mode) {
+// REPL frames and --parts payloads use 4-byte big-endian unsigned lengths.
+bool read_u32(std::istream& in, uint32_t& value) {
+    unsigned char bytes[4];
+    if (!in.read(reinterpret_cast<char*>(bytes), sizeof(bytes))) {
+        return false;
+    }
+    value = (uint32_t(bytes[0]) << 24) | (uint32_t(bytes[1]) << 16) |
+            (uint32_t(bytes[2]) << 8) | uint32_t(bytes[3]);
+    return true;
+}
+
+void write_u32(std::ostream& out, uint32_t value) {
+    const char bytes[4] = {
+        static_cast<char>(value >> 24), static_cast<char>(value >> 16),
+        static_cast<char>(value >> 8), static_cast<char>(value)
+    };
+    out.write(bytes, sizeof(bytes));
+}
+
+// Split a --parts payload (a sequence of length-prefixed fragments) into parts.
+// Returns false if the payload is truncated.
+bool split_framed_parts(const std::string& payload, std::vector<std::string>& parts) {
+    std::istringstream in(payload);
+    uint32_t len;
+    while (read_u32(in, len)) {
+        std::string part(len, '\0');
+        if (!in.read(part.data(), static_cast<std::streamsize>(len))) {
+            return false;
+        }
+        parts.push_back(std::move(part));
+    }
+    return in.gcount() == 0;
+}
+
+int do_dumps(const std::string& input, std::optional<size_t> max_length, bool xml_mode,
+             const char* eol, std::ostream& out, std::ostream& err) {
     try {
         // Parse input (JSON or XML)
         sisl::json j = xml_mode ? sisl::xml_to_json(input) : sisl::json::parse(input);
 
         if (!j.is_object()) {
-            std::cerr << "Error: Top-level input must be an object\n";
+            err << "Error: Top-level input must be an object\n";
             return EXIT_PARSE_ERROR;
         }
 
@@ -57,214 +119,244 @@ int do_dumps(const std::string& input, std::optional<size_t> max_length, bool xm
             std::string full = sisl::dumps(j);
             if (full.size() <= *max_length) {
                 // Fits in one part
-                std::cout << full << "\n";
+                out << full << eol;
             } else {
                 // Need to split
                 auto parts = sisl::split_dumps(j, *max_length);
                 if (parts.empty()) {
                     // Shouldn't happen if full.size() > max_length
-                    std::cout << full << "\n";
+                    out << full << eol;
                 } else {
                     // Output as JSON array of SISL strings
                     sisl::json arr = sisl::json::array();
                     for (const auto& part : parts) {
                         arr.push_back(part);
                     }
-                    std::cout << arr.dump() << "\n";
+                    out << arr.dump() << eol;
                 }
             }
         } else {
             // No max-length, output single SISL string
-            std::cout << sisl::dumps(j) << "\n";
+            out << sisl::dumps(j) << eol;
         }
 
         return EXIT_SUCCESS_CODE;
     } catch (const sisl::XmlError& e) {
-        std::cerr << "XML error: " << e.what() << "\n";
+        err << "XML error: " << e.what() << "\n";
         return EXIT_PARSE_ERROR;
     } catch (const sisl::json::parse_error& e) {
-        std::cerr << "JSON parse error: " << e.what() << "\n";
+        err << "JSON parse error: " << e.what() << "\n";
         return EXIT_PARSE_ERROR;
     } catch (const sisl::CodecError& e) {
-        std::cerr << "Codec error: " << e.what() << "\n";
+        err << "Codec error: " << e.what() << "\n";
         return EXIT_PARSE_ERROR;
     } catch (const std::exception& e) {
-        std::cerr << "Internal error: " << e.what() << "\n";
+        err << "Internal error: " << e.what() << "\n";
         return EXIT_INTERNAL_ERROR;
     }
 }
 
-int do_loads(const std::string& input, bool xml_mode) {
+int do_loads(const std::string& input, bool xml_mode, bool framed_parts, const char* eol,
+             std::ostream& out, std::ostream& err) {
     try {
         sisl::json result;
 
-        // Try to parse as JSON array first (for joining multiple SISL strings)
-        bool is_json_array = false;
-        try {
-            auto parsed = sisl::json::parse(input);
-            if (parsed.is_array()) {
-                // Check if all elements are strings
-                bool all_strings = true;
-                for (const auto& elem : parsed) {
-                    if (!elem.is_string()) {
-                        all_strings = false;
-                        break;
-                    }
-                }
-                if (all_strings && !parsed.empty()) {
-                    is_json_array = true;
-                    // Extract strings and merge
-                    std::vector<std::string> sisl_strings;
+        if (framed_parts) {
+            // Fragments sent by a --repl client with --parts are merged directly
+            std::vector<std::string> sisl_strings;
+            if (!split_framed_parts(input, sisl_strings)) {
+                err << "Error: Truncated --parts payload\n";
+                return EXIT_PARSE_ERROR;
+            }
+            if (sisl_strings.empty()) {
+                err << "Error: --parts requires at least one fragment\n";
+                return EXIT_PARSE_ERROR;
+            }
+            result = sisl::merge_sisl_strings(sisl_strings);
+        } else {
+            // Try to parse as JSON array first (for joining multiple SISL strings)
+            bool is_json_array = false;
+            try {
+                auto parsed = sisl::json::parse(input);
+                if (parsed.is_array()) {
+                    // Check if all elements are strings
+                    bool all_strings = true;
                     for (const auto& elem : parsed) {
-                        sisl_strings.push_back(elem.get<std::string>());
+                        if (!elem.is_string()) {
+                            all_strings = false;
+                            break;
+                        }
+                    }
+                    if (all_strings && !parsed.empty()) {
+                        is_json_array = true;
+                        // Extract strings and merge
+                        std::vector<std::string> sisl_strings;
+                        for (const auto& elem : parsed) {
+                            sisl_strings.push_back(elem.get<std::string>());
+                        }
+                        result = sisl::merge_sisl_strings(sisl_strings);
                     }
-                    result = sisl::merge_sisl_strings(sisl_strings);
                 }
+            } catch (...) {
+                // Not valid JSON, treat as raw SISL
             }
-        } catch (...) {
-            // Not valid JSON, treat as raw SISL
-        }
 
-        if (!is_json_array) {
-            // Parse as single SISL string
-            result = sisl::loads(input);
+            if (!is_json_array) {
+                // Parse as single SISL string
+                result = sisl::loads(input);
+            }
         }
 
         // Output result
         if (xml_mode) {
-            std::cout << sisl::json_to_xml(result);
+            out << sisl::json_to_xml(result);
         } else {
-            std::cout << result.dump() << "\n";
+            out << result.dump() << eol;
         }
         return EXIT_SUCCESS_CODE;
 
     } catch (const sisl::XmlError& e) {
-        std::cerr << "XML error: " << e.what() << "\n";
+        err << "XML error: " << e.what() << "\n";
         return EXIT_PARSE_ERROR;
     } catch (const sisl::ParseError& e) {
-        std::cerr << "SISL parse error: " << e.what() << "\n";
+        err << "SISL parse error: " << e.what() << "\n";
         return EXIT_PARSE_ERROR;
     } catch (const sisl::LexerError& e) {
-        std::cerr << "SISL lexer error: " << e.what() << "\n";
+        err << "SISL lexer error: " << e.what() << "\n";
         return EXIT_PARSE_ERROR;
     } catch (const sisl::CodecError& e) {
-        std::cerr << "Codec error: " << e.what() << "\n";
+        err << "Codec error: " << e.what() << "\n";
         return EXIT_PARSE_ERROR;
     } catch (const sisl::EscapeError& e) {
-        std::cerr << "Escape error: " << e.what() << "\n";
+        err << "Escape error: " << e.what() << "\n";
         return EXIT_PARSE_ERROR;
     } catch (const std::exception& e) {
-        std::cerr << "Internal error: " << e.what() << "\n";
+        err << "Internal error: " << e.what() << "\n";
         return EXIT_INTERNAL_ERROR;
     }
 }
 
-int main(int argc, char* argv[]) {
-    bool do_dumps_mode = false;
-    bool do_loads_mode = false;
-    bool xml_mode = false;
-    std::optional<size_t> max_length;
-    std::string input_file;
-    std::string output_file;
-
-    // Parse arguments
-    for (int i = 1; i < argc; i++) {
-        std::string arg = argv[i];
+// Parse command-line style arguments into opts.
+// Returns an exit code if processing should stop (e.g. --help or a bad argument).
+std::optional<int> parse_args(const std::vector<std::string>& args, Options& opts,
+                              const char* prog, std::ostream& err) {
+    for (size_t i = 0; i < args.size(); i++) {
+        const std::string& arg = args[i];
         if (arg == "--dumps") {
-            do_dumps_mode = true;
+            opts.do_dumps_mode = true;
         } else if (arg == "--loads") {
-            do_loads_mode = true;
+            opts.do_loads_mode = true;
         } else if (arg == "--xml") {
-            xml_mode = true;
+            opts.xml_mode = true;
+        } else if (arg == "--repl") {
+            opts.repl_mode = true;
+        } else if (arg == "--parts") {
+            opts.parts_mode = true;
         } else if (arg == "--max-length") {
-            if (i + 1 >= argc) {
-                std::cerr << "Error: --max-length requires a value\n";
+            if (i + 1 >= args.size()) {
+                err << "Error: --max-length requires a value\n";
                 return EXIT_PARSE_ERROR;
             }
             try {
-                max_length = std::stoull(argv[++i]);
+                opts.max_length = std::stoull(args[++i]);
             } catch (...) {
-                std::cerr << "Error: Invalid max-length value\n";
+                err << "Error: Invalid max-length value\n";
                 return EXIT_PARSE_ERROR;
             }
         } else if (arg == "--input") {
-            if (i + 1 >= argc) {
-                std::cerr << "Error: --input requires a file path\n";
+            if (i + 1 >= args.size()) {
+                err << "Error: --input requires a file path\n";
                 return EXIT_PARSE_ERROR;
             }
-            input_file = argv[++i];
+            opts.input_file = args[++i];
         } else if (arg == "--output") {
-            if (i + 1 >= argc) {
-                std::cerr << "Error: --output requires a file path\n";
+            if (i + 1 >= args.size()) {
+                err << "Error: --output requires a file path\n";
                 return EXIT_PARSE_ERROR;
             }
-            output_file = argv[++i];
+            opts.output_file = args[++i];
+        } else if (arg == "--server") {
+            if (i + 1 >= args.size()) {
+                err << "Error: --server requires a socket path\n";
+                return EXIT_PARSE_ERROR;
+            }
+            opts.server_path = args[++i];
         } else if (arg == "--help" || arg == "-h") {
-            print_usage(argv[0]);
+            print_usage(prog, err);
             return EXIT_SUCCESS_CODE;
         } else {
-            std::cerr << "Error: Unknown argument: " << arg << "\n";
-            print_usage(argv[0]);
+            err << "Error: Unknown argument: " << arg << "\n";
+            print_usage(prog, err);
             return EXIT_PARSE_ERROR;
         }
     }
+    return std::nullopt;
+}
 
+// Run a single --dumps/--loads conversion as described by opts.
+// Input comes from opts.input_file or `in`; output goes to opts.output_file or `out`.
+int run(const Options& opts, std::istream& in, std::ostream& out, std::ostream& err,
+        const char* prog) {
     // Validate arguments
-    if (do_dumps_mode && do_loads_mode) {
-        std::cerr << "Error: Cannot use both --dumps and --loads\n";
+    if (opts.do_dumps_mode && opts.do_loads_mode) {
+        err << "Error: Cannot use both --dumps and --loads\n";
         return EXIT_PARSE_ERROR;
     }
 
-    if (!do_dumps_mode && !do_loads_mode) {
-        std::cerr << "Error: Must specify --dumps or --loads\n";
-        print_usage(argv[0]);
+    if (!opts.do_dumps_mode && !opts.do_loads_mode) {
+        err << "Error: Must specify --dumps or --loads\n";
+        print_usage(prog, err);
         return EXIT_PARSE_ERROR;
     }
 
-    if (max_length && !do_dumps_mode) {
-        std::cerr << "Error: --max-length can only be used with --dumps\n";
+    if (opts.max_length && !opts.do_dumps_mode) {
+        err << "Error: --max-length can only be used with --dumps\n";
+        return EXIT_PARSE_ERROR;
+    }
+
+    if (opts.parts_mode && !opts.do_loads_mode) {
+        err << "Error: --parts can only be used with --loads\n";
         return EXIT_PARSE_ERROR;
     }
 
     // Read input
     std::string input;
     try {
-        input = read_input(input_file);
+        input = read_input(opts.input_file, in);
     } catch (const std::exception& e) {
-        std::cerr << "Error: " << e.what() << "\n";
+        err << "Error: " << e.what() << "\n";
         return EXIT_PARSE_ERROR;
     }
 
     // Set up output redirection.
     // Write to a temp file first so that on failure the target isn't truncated.
     std::ofstream ofs;
-    std::streambuf* orig_cout = nullptr;
     std::string tmp_path;
-    if (!output_file.empty()) {
-        tmp_path = output_file + ".tmp";
+    if (!opts.output_file.empty()) {
+        tmp_path = opts.output_file + ".tmp";
         ofs.open(tmp_path);
         if (!ofs) {
-            std::cerr << "Error: Cannot open output file: " << output_file << "\n";
+            err << "Error: Cannot open output file: " << opts.output_file << "\n";
             return EXIT_PARSE_ERROR;
         }
-        orig_cout = std::cout.rdbuf(ofs.rdbuf());
     }
+    std::ostream& target = opts.output_file.empty() ? out : ofs;
 
     // Execute
+    const char* eol = (opts.stdout_newline || !opts.output_file.empty()) ? "\n" : "";
     int rc;
-    if (do_dumps_mode) {
-        rc = do_dumps(input, max_length, xml_mode);
+    if (opts.do_dumps_mode) {
+        rc = do_dumps(input, opts.max_length, opts.xml_mode, eol, target, err);
     } else {
-        rc = do_loads(input, xml_mode);
+        rc = do_loads(input, opts.xml_mode, opts.parts_mode, eol, target, err);
     }
 
-    // Restore stdout and finalize output file
-    if (orig_cout) {
-        std::cout.rdbuf(orig_cout);
+    // Finalize output file
+    if (!opts.output_file.empty()) {
         ofs.close();
         if (rc == EXIT_SUCCESS_CODE) {
-            if (std::rename(tmp_path.c_str(), output_file.c_str()) != 0) {
-                std::cerr << "Error: Cannot write output file: " << output_file << "\n";
+            if (std::rename(tmp_path.c_str(), opts.output_file.c_str()) != 0) {
+                err << "Error: Cannot write output file: " << opts.output_file << "\n";
                 std::remove(tmp_path.c_str());
                 return EXIT_INTERNAL_ERROR;
             }
@@ -275,3 +367,202 @@ int main(int argc, char* argv[]) {
 
     return rc;
 }
+
+// Serve framed requests from `in` until EOF, so that callers issuing many small
+// conversions pay for process start-up only once.
+//
+// Request:  ARGSLEN LEN <ARGSLEN bytes: ARG\tARG...> <LEN bytes of stdin data>
+// Response: RC OUTLEN ERRLEN <OUTLEN bytes of stdout> <ERRLEN bytes of stderr>
+//
+// ARGSLEN, LEN, RC, OUTLEN and ERRLEN are 4-byte big-endian unsigned integers.
+// The ARG fields are the same arguments accepted on the command line, and each
+// request behaves like a separate `sislc ARG...` invocation, except that the
+// trailing newline after JSON/SISL output on stdout is omitted.
+int run_repl(std::istream& in, std::ostream& out, const char* prog) {
+    while (true) {
+        uint32_t args_len;
+        uint32_t payload_len;
+        if (!read_u32(in, args_len)) {
+            if (in.gcount() == 0) {
+                break;  // Clean EOF between requests
+            }
+            std::cerr << "Error: Truncated request header\n";
+            return EXIT_PARSE_ERROR;
+        }
+        if (!read_u32(in, payload_len)) {
+            std::cerr << "Error: Truncated request header\n";
+            return EXIT_PARSE_ERROR;
+        }
+
+        std::string args_str(args_len, '\0');
+        std::string payload(payload_len, '\0');
+        if (!in.read(args_str.data(), static_cast<std::streamsize>(args_len)) ||
+            !in.read(payload.data(), static_cast<std::streamsize>(payload_len))) {
+            std::cerr << "Error: Truncated request payload\n";
+            return EXIT_PARSE_ERROR;
+        }
+
+        std::vector<std::string> fields;
+        if (!args_str.empty()) {
+            size_t start = 0;
+            size_t tab;
+            while ((tab = args_str.find('\t', start)) != std::string::npos) {
+                fields.push_back(args_str.substr(start, tab - start));
+                start = tab + 1;
+            }
+            fields.push_back(args_str.substr(start));
+        }
+
+        std::istringstream req_in(payload);
+        std::ostringstream req_out;
+        std::ostringstream req_err;
+        Options opts;
+        int rc;
+        if (auto early = parse_args(fields, opts, prog, req_err)) {
+            rc = *early;
+        } else if (opts.repl_mode || !opts.server_path.empty()) {
+            req_err << "Error: --repl and --server cannot be used inside a request\n";
+            rc = EXIT_PARSE_ERROR;
+        } else {
+            opts.stdout_newline = false;
+            rc = run(opts, req_in, req_out, req_err, prog);
+        }
+
+        std::string out_str = req_out.str();
+        std::string err_str = req_err.str();
+        write_u32(out, static_cast<uint32_t>(rc));
+        write_u32(out, static_cast<uint32_t>(out_str.size()));
+        write_u32(out, static_cast<uint32_t>(err_str.size()));
+        out << out_str << err_str;
+        // Flush only once the pipelined requests already buffered are
+        // answered, so a batch of requests costs one write, not one per item.
+        if (in.rdbuf()->in_avail() <= 0) {
+            out.flush();
+        }
+    }
+    return EXIT_SUCCESS_CODE;
+}
+
+// Socket path removed by the signal handler when the server is stopped, and
+// the identity of the socket file this server bound there
+static char g_server_path[sizeof(sockaddr_un::sun_path)];
+static dev_t g_server_dev;
+static ino_t g_server_ino;
+
+// Remove our socket file, unless another server has since replaced it.
+// Only async-signal-safe calls, as this runs in the signal handler.
+static void unlink_own_socket() {
+    struct stat st;
+    if (stat(g_server_path, &st) == 0 &&
+        st.st_dev == g_server_dev && st.st_ino == g_server_ino) {
+        unlink(g_server_path);
+    }
+}
+
+extern "C" void stop_server(int) {
+    unlink_own_socket();
+    _exit(EXIT_SUCCESS_CODE);
+}
+
+// Listen on a Unix domain socket and serve each connection with the --repl
+// protocol in a forked child, so several clients can share one sislc binary
+// and a connection outlives the listener. Runs until SIGTERM/SIGINT.
+int run_server(const std::string& path, const char* prog) {
+    sockaddr_un addr{};
+    if (path.size() >= sizeof(addr.sun_path)) {
+        std::cerr << "Error: Socket path too long: " << path << "\n";
+        return EXIT_PARSE_ERROR;
+    }
+    addr.sun_family = AF_UNIX;
+    std::memcpy(addr.sun_path, path.c_str(), path.size() + 1);
+    std::memcpy(g_server_path, path.c_str(), path.size() + 1);
+
+    int listen_fd = socket(AF_UNIX, SOCK_STREAM, 0);
+    if (listen_fd < 0) {
+        std::cerr << "Error: Cannot create socket: " << std::strerror(errno) << "\n";
+        return EXIT_INTERNAL_ERROR;
+    }
+    // Replace a socket file left behind by a server that did not shut down cleanly
+    unlink(path.c_str());
+    if (bind(listen_fd, reinterpret_cast<sockaddr*>(&addr), sizeof(addr)) != 0 ||
+        listen(listen_fd, SOMAXCONN) != 0) {
+        std::cerr << "Error: Cannot listen on " << path << ": " << std::strerror(errno) << "\n";
+        close(listen_fd);
+        return EXIT_INTERNAL_ERROR;
+    }
+    struct stat st;
+    if (stat(path.c_str(), &st) != 0) {
+        std::cerr << "Error: Cannot stat " << path << ": " << std::strerror(errno) << "\n";
+        close(listen_fd);
+        return EXIT_INTERNAL_ERROR;
+    }
+    g_server_dev = st.st_dev;
+    g_server_ino = st.st_ino;
+
+    std::signal(SIGCHLD, SIG_IGN);  // Children are reaped automatically
+    std::signal(SIGTERM, stop_server);
+    std::signal(SIGINT, stop_server);
+
+    while (true) {
+        int conn = accept(listen_fd, nullptr, nullptr);
+        if (conn < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+            std::cerr << "Error: accept failed: " << std::strerror(errno) << "\n";
+            unlink_own_socket();
+            return EXIT_INTERNAL_ERROR;
+        }
+        pid_t pid = fork();
+        if (pid == 0) {
+            close(listen_fd);
+            std::signal(SIGTERM, SIG_DFL);
+            std::signal(SIGINT, SIG_DFL);
+            dup2(conn, STDIN_FILENO);
+            dup2(conn, STDOUT_FILENO);
+            close(conn);
+            int rc = run_repl(std::cin, std::cout, prog);
+            std::cout.flush();
+            _exit(rc);
+        }
+        if (pid < 0) {
+            std::cerr << "Error: fork failed: " << std::strerror(errno) << "\n";
+        }
+        close(conn);
+    }
+}
+
+int main(int argc, char* argv[]) {
+    Options opts;
+    std::vector<std::string> args(argv + 1, argv + argc);
+    if (auto early = parse_args(args, opts, argv[0], std::cerr)) {
+        return *early;
+    }
+
+    if (opts.repl_mode) {
+        if (args.size() != 1) {
+            std::cerr << "Error: --repl cannot be combined with other options\n";
+            return EXIT_PARSE_ERROR;
+        }
+        std::ios::sync_with_stdio(false);
+        std::cin.tie(nullptr);
+        return run_repl(std::cin, std::cout, argv[0]);
+    }
+
+    if (!opts.server_path.empty()) {
+        if (args.size() != 2) {
+            std::cerr << "Error: --server cannot be combined with other options\n";
+            return EXIT_PARSE_ERROR;
+        }
+        std::ios::sync_with_stdio(false);
+        std::cin.tie(nullptr);
+        return run_server(opts.server_path, argv[0]);
+    }
+
+    if (opts.parts_mode) {
+        std::cerr << "Error: --parts is only available in --repl requests\n";
+        return EXIT_PARSE_ERROR;
+    }
+
+    return run(opts, std::cin, std::cout, std::cerr, argv[0]);
+}
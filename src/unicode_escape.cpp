@@ -1,6 +1,4 @@
 #include "unicode_escape.hpp"
-#include <sstream>
-#include <iomanip>
 
 namespace sisl {
 
@@ -115,9 +113,24 @@ std::string unescape_sisl_string(const std::string& input) {
 }
 
 std::string escape_sisl_string(const std::string& input) {
+    static const char hex_digits[] = "0123456789abcdef";
     std::string result;
+    result.reserve(input.size());
 
-    for (unsigned char c : input) {
+    size_t pos = 0;
+    while (pos < input.size()) {
+        // Copy the run of printable ASCII (0x20-0x7E, excluding " and \)
+        // up to the next byte that needs escaping in one append
+        size_t run_end = pos;
+        while (run_end < input.size()) {
+            unsigned char c = input[run_end];
+            if (c < 0x20 || c > 0x7E || c == '"' || c == '\\') break;
+            run_end++;
+        }
+        result.append(input, pos, run_end - pos);
+        if (run_end == input.size()) break;
+
+        unsigned char c = input[run_end];
         switch (c) {
             case '"':
                 result += "\\\"";
@@ -135,17 +148,13 @@ std::string escape_sisl_string(const std::string& input) {
                 result += "\\n";
                 break;
             default:
-                // Printable ASCII (0x20-0x7E, excluding " and \)
-                if (c >= 0x20 && c <= 0x7E) {
-                    result += c;
-                } else {
-                    // Use \xHH for non-printable bytes
-                    std::ostringstream oss;
-                    oss << "\\x" << std::hex << std::setfill('0') << std::setw(2) << static_cast<int>(c);
-                    result += oss.str();
-                }
+                // Use \xHH for non-printable bytes
+                result += "\\x";
+                result += hex_digits[c >> 4];
+                result += hex_digits[c & 0xF];
                 break;
         }
+        pos = run_end + 1;
     }
 
     return result;
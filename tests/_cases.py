@@ -0,0 +1,28 @@
+"""Helpers for building and checking parametrized round-trip cases."""
+
+import json
+
+import pytest
+
+
+def case(obj, id, *values):
+    """A pytest.param of obj with its JSON encoding precomputed.
+
+    Any further values are appended to the param after the JSON.
+    """
+    return pytest.param(obj, json.dumps(obj), *values, id=id)
+
+
+def approx_deep(obj, **tolerance):
+    """obj with every float wrapped in pytest.approx, at any nesting depth.
+
+    pytest.approx rejects nested containers, so compare against this
+    instead: ``assert result == approx_deep(expected, abs=1e-5)``.
+    """
+    if isinstance(obj, float):
+        return pytest.approx(obj, **tolerance)
+    if isinstance(obj, dict):
+        return {key: approx_deep(value, **tolerance) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [approx_deep(value, **tolerance) for value in obj]
+    return obj
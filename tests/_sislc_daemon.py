@@ -0,0 +1,108 @@
+"""Shared `sislc --server` daemon for pytest-xdist workers.
+
+Rather than every xdist worker launching its own `sislc --repl`, the first
+worker to need sislc starts one `sislc --server` on a Unix domain socket and
+the others connect to it. The server forks a child per connection, so a
+connection keeps working even after the worker that started the server has
+finished and stopped it.
+
+Each connected worker is still served by its own sislc process: the forks
+share the binary's pages copy-on-write and skip exec and startup, but memory
+use still grows with the number of workers.
+
+Starting, connecting and stopping all happen under one lock file, so a worker
+never connects to a server that is being stopped.
+"""
+
+import fcntl
+import os
+import socket
+import struct
+import subprocess
+import time
+
+# How long to wait for a freshly started server to accept connections
+STARTUP_TIMEOUT = 10.0
+
+# A --repl request that sislc always answers: --loads of an empty object
+_PING = struct.pack(">II", len(b"--loads"), len(b"{}")) + b"--loads" + b"{}"
+_RESPONSE_HEADER = struct.Struct(">III")
+
+
+def _recv_exact(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed by sislc --server")
+        data += chunk
+    return data
+
+
+def _connect(sock_path):
+    """Connect to the server and wait until a child is serving the connection.
+
+    connect() returns once the connection is queued, before the server has
+    accepted it; a round trip proves it was accepted, so the connection no
+    longer depends on the listening server staying up.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(sock_path)
+        sock.sendall(_PING)
+        _, out_len, err_len = _RESPONSE_HEADER.unpack(
+            _recv_exact(sock, _RESPONSE_HEADER.size)
+        )
+        _recv_exact(sock, out_len + err_len)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _lock_path(base_dir):
+    return os.path.join(base_dir, "sislc.sock.lock")
+
+
+def connect_or_start(sislc_path, base_dir):
+    """Connect to the sislc server for this test run, starting it if needed.
+
+    base_dir must be shared by all workers of the run. Returns (sock, proc):
+    proc is the server process if this call started it, else None.
+    """
+    sock_path = os.path.join(base_dir, "sislc.sock")
+    with open(_lock_path(base_dir), "w") as lock:
+        # Serialize workers so only one of them starts the server
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            return _connect(sock_path), None
+        except OSError:
+            pass
+
+        proc = subprocess.Popen([sislc_path, "--server", sock_path])
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                return _connect(sock_path), proc
+            except OSError:
+                if proc.poll() is not None or time.monotonic() > deadline:
+                    _terminate(proc)
+                    raise RuntimeError(f"sislc --server did not start on {sock_path}")
+                time.sleep(0.01)
+
+
+def stop(proc, base_dir):
+    """Stop a server started by connect_or_start() with the same base_dir.
+
+    Connections that are already open keep being served until they close.
+    """
+    with open(_lock_path(base_dir), "w") as lock:
+        # Wait out any worker that is connecting, so it is not cut off
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        _terminate(proc)
+
+
+def _terminate(proc):
+    if proc.poll() is None:
+        proc.terminate()
+    proc.wait()
@@ -0,0 +1,23 @@
+"""XML parsing for checking sislc's XML output, via lxml when installed."""
+
+try:
+    from lxml import etree as ET
+
+    # lxml parsers can be reused, so one serves every call
+    _PARSER = ET.XMLParser()
+except ImportError:  # stdlib ElementTree is API-compatible for the tests
+    import xml.etree.ElementTree as ET
+
+    # stdlib parsers are single-use; None makes fromstring build its own
+    _PARSER = None
+
+
+def parse_xml(xml_text):
+    """Parse an XML document (str or bytes) into its root element.
+
+    Text is encoded first: lxml rejects str input that carries an
+    encoding declaration, which sislc always writes.
+    """
+    if isinstance(xml_text, str):
+        xml_text = xml_text.encode()
+    return ET.fromstring(xml_text, parser=_PARSER)
@@ -1,137 +1,627 @@
 """Pytest configuration and shared fixtures for SISL interoperability tests."""
 
+import fcntl
+import hashlib
+import importlib.metadata
+import io
+import struct
 import subprocess
 import json
 import os
+import pathlib
+import shutil
 import tempfile
+import threading
+import typing
 import pytest
+import pysisl
+
+import _sislc_daemon
+from _cases import approx_deep
+from _jsonio import json_dumps, json_loads
+
+try:
+    import pytest_benchmark  # noqa: F401 (provides the benchmark fixture)
+except ImportError:
+    pytest_benchmark = None
 
 # Path to sislc binary
 SISLC_PATH = os.path.join(os.path.dirname(__file__), "..", "build", "sislc")
 
+# Set SISLC_NO_REPL=1 to run every conversion as a separate sislc process
+# (useful when debugging a crash that takes the REPL worker down).
+USE_REPL = not os.environ.get("SISLC_NO_REPL")
 
-@pytest.fixture
-def sislc():
-    """Fixture providing sislc helper functions."""
-    class SislcHelper:
-        @staticmethod
-        def dumps(json_obj, max_length=None):
-            """Convert JSON to SISL using sislc."""
-            cmd = [SISLC_PATH, "--dumps"]
-            if max_length:
-                cmd.extend(["--max-length", str(max_length)])
-            result = subprocess.run(
-                cmd,
-                input=json.dumps(json_obj),
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                raise RuntimeError(f"sislc --dumps failed: {result.stderr}")
-            output = result.stdout.strip()
+
+# rc, stdout length, stderr length
+_RESPONSE_HEADER = struct.Struct(">III")
+
+# Most buffers a single writev()/sendmsg() call accepts
+_IOV_MAX = os.sysconf("SC_IOV_MAX")
+
+# Batches up to this size fit in the kernel's pipe/socket buffer, so they can
+# be written before reading any response; bigger ones are written on a thread.
+_INLINE_WRITE_MAX = 65536
+
+
+class SislcServer:
+    """A long-lived `sislc --repl` process serving framed requests.
+
+    Each request is the argument list of an equivalent sislc invocation plus
+    its stdin bytes; the response carries the exit code, stdout and stderr
+    as bytes. Frames are length-prefixed with 4-byte big-endian integers.
+    """
+
+    def __init__(self, path):
+        self.proc = subprocess.Popen(
+            [path, "--repl"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0
+        )
+        # Buffer responses on our side so a response usually arrives in one
+        # read() rather than one for the header and one for the body.
+        self._stdout = io.BufferedReader(self.proc.stdout, 65536)
+
+    def request(self, args, payload):
+        """Run sislc with args on payload, returning (returncode, stdout, stderr)."""
+        return self.request_many([(args, payload)])[0]
+
+    def request_many(self, requests):
+        """Pipeline several (args, payload) requests, returning their responses.
+
+        All requests are sent without waiting for responses, so the batch
+        costs one round trip to the worker instead of one per request.
+        Large batches are written from a background thread while responses
+        are read: otherwise, once sislc's output buffer filled up, sislc and
+        this process would each block writing to the other.
+        """
+        frames = []
+        for args, payload in requests:
+            arg_bytes = "\t".join(args).encode()
+            frames.append(struct.pack(">II", len(arg_bytes), len(payload)))
+            frames.append(arg_bytes)
+            frames.append(payload)
+        if sum(len(frame) for frame in frames) <= _INLINE_WRITE_MAX:
+            self._write_all(frames)
+            return [self._read_response() for _ in requests]
+
+        def write():
+            try:
+                self._write_all(frames)
+            except OSError:
+                pass  # sislc went away; reading its responses reports why
+
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+        try:
+            return [self._read_response() for _ in requests]
+        finally:
+            writer.join()
+
+    def _write_all(self, buffers):
+        """Gather-write buffers without joining them into one bytes object."""
+        views = [memoryview(buf) for buf in buffers if buf]
+        while views:
+            written = self._writev(views[:_IOV_MAX])
+            while written:
+                if written >= len(views[0]):
+                    written -= len(views.pop(0))
+                else:
+                    views[0] = views[0][written:]
+                    written = 0
+
+    def _writev(self, views):
+        return os.writev(self.proc.stdin.fileno(), views)
+
+    def _exit_details(self):
+        return self.proc.stderr.read().decode()
+
+    def _read_response(self):
+        status = self._stdout.read(_RESPONSE_HEADER.size)
+        if not status:
+            raise RuntimeError(f"sislc --repl exited unexpectedly: {self._exit_details()}")
+        if len(status) != _RESPONSE_HEADER.size:
+            raise RuntimeError("sislc --repl closed stdout mid-response")
+        rc, out_len, err_len = _RESPONSE_HEADER.unpack(status)
+        return rc, self._read_exact(out_len), self._read_exact(err_len)
+
+    def _read_exact(self, size):
+        """Read exactly size bytes straight into a new bytearray."""
+        data = bytearray(size)
+        if self._stdout.readinto(data) != size:
+            raise RuntimeError("sislc --repl closed stdout mid-response")
+        return data
+
+    def close(self):
+        """Close stdin so sislc sees EOF and exits cleanly."""
+        self.proc.stdin.close()
+        self.proc.wait()
+        self._stdout.close()
+        self.proc.stderr.close()
+
+
+class SislcSocketClient(SislcServer):
+    """A connection to a shared `sislc --server`, speaking the --repl protocol."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self._stdout = sock.makefile("rb", buffering=65536)
+
+    def _writev(self, views):
+        return self.sock.sendmsg(views)
+
+    def _exit_details(self):
+        return "connection closed by sislc --server"
+
+    def close(self):
+        """Close the connection; the server's child for it then exits."""
+        self._stdout.close()
+        self.sock.close()
+
+
+class Result(typing.NamedTuple):
+    """Exit code and raw output of a one-shot sislc process."""
+
+    rc: int
+    stdout: bytes
+    stderr: bytes
+
+
+class SislcHelper:
+    """sislc conversions used by the tests, shared across the whole session."""
+
+    def __init__(self, server):
+        self.server = server
+        # dumps_xml results by (xml_str, max_length); shared, so don't mutate
+        self._dumps_xml_cache = {}
+
+    def _run(self, args, input_data):
+        """Run sislc with args on str or bytes input.
+
+        Returns (returncode, stdout, stderr) with the outputs left as bytes,
+        so callers only decode what they actually need as text.
+        """
+        if isinstance(input_data, str):
+            input_data = input_data.encode()
+        if self.server is not None:
+            return self.server.request(args, input_data)
+        result = subprocess.run(
+            [SISLC_PATH] + args,
+            input=input_data,
+            capture_output=True
+        )
+        stdout = result.stdout
+        # Match --repl, which omits the newline a one-shot sislc appends to
+        # JSON/SISL output (XML output from --loads --xml has none added).
+        if ("--dumps" in args or "--xml" not in args) and stdout.endswith(b"\n"):
+            stdout = stdout[:-1]
+        return result.returncode, stdout, result.stderr
+
+    def _run_many(self, requests):
+        """Run several (args, input_data) requests, pipelined when possible."""
+        if self.server is None:
+            return [self._run(args, input_data) for args, input_data in requests]
+        return self.server.request_many([
+            (args, input_data.encode() if isinstance(input_data, str) else input_data)
+            for args, input_data in requests
+        ])
+
+    def dumps(self, json_obj, max_length=None):
+        """Convert JSON to SISL using sislc."""
+        return self.dumps_many([json_obj], max_length)[0]
+
+    def dumps_many(self, json_objs, max_length=None):
+        """Convert several JSON objects to SISL in one pipelined batch."""
+        args = ["--dumps"]
+        if max_length:
+            args.extend(["--max-length", str(max_length)])
+        results = []
+        for rc, stdout, stderr in self._run_many([(args, json_dumps(obj)) for obj in json_objs]):
+            if rc != 0:
+                raise RuntimeError(f"sislc --dumps failed: {stderr.decode()}")
             # If it's a JSON array (split result), parse it
-            if max_length and output.startswith("["):
-                return json.loads(output)
-            return output
+            if max_length and stdout.startswith(b"["):
+                results.append(json_loads(stdout))
+            else:
+                results.append(stdout.decode())
+        return results
+
+    def loads(self, sisl_input):
+        """Convert SISL to JSON using sislc."""
+        return self.loads_many([sisl_input])[0]
+
+    def loads_many(self, sisl_inputs):
+        """Convert several SISL inputs to JSON in one pipelined batch.
 
-        @staticmethod
-        def loads(sisl_input):
-            """Convert SISL to JSON using sislc."""
+        Each input is a SISL string or a list of fragments to join.
+        """
+        requests = []
+        for sisl_input in sisl_inputs:
             # If input is a list, convert to JSON array string
             if isinstance(sisl_input, list):
-                sisl_input = json.dumps(sisl_input)
-            result = subprocess.run(
-                [SISLC_PATH, "--loads"],
-                input=sisl_input,
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                raise RuntimeError(f"sislc --loads failed: {result.stderr}")
-            return json.loads(result.stdout.strip())
+                sisl_input = json_dumps(sisl_input)
+            requests.append((["--loads"], sisl_input))
+        results = []
+        for rc, stdout, stderr in self._run_many(requests):
+            if rc != 0:
+                raise RuntimeError(f"sislc --loads failed: {stderr.decode()}")
+            results.append(json_loads(stdout))
+        return results
 
-        @staticmethod
-        def loads_raw(sisl_input):
-            """Convert SISL to raw JSON string using sislc (no Python parse)."""
-            if isinstance(sisl_input, list):
-                sisl_input = json.dumps(sisl_input)
-            result = subprocess.run(
-                [SISLC_PATH, "--loads"],
-                input=sisl_input,
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                raise RuntimeError(f"sislc --loads failed: {result.stderr}")
-            return result.stdout.strip()
-
-        @staticmethod
-        def dumps_raw(json_str, max_length=None):
-            """Convert raw JSON string to SISL using sislc."""
-            cmd = [SISLC_PATH, "--dumps"]
-            if max_length:
-                cmd.extend(["--max-length", str(max_length)])
-            result = subprocess.run(
-                cmd,
-                input=json_str,
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                raise RuntimeError(f"sislc --dumps failed: {result.stderr}")
-            return result.stdout.strip()
-
-        @staticmethod
-        def dumps_xml(xml_str, max_length=None):
-            """Convert XML string to SISL using sislc --dumps --xml."""
-            cmd = [SISLC_PATH, "--dumps", "--xml"]
-            if max_length:
-                cmd.extend(["--max-length", str(max_length)])
-            result = subprocess.run(
-                cmd,
-                input=xml_str,
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                raise RuntimeError(f"sislc --dumps --xml failed: {result.stderr}")
-            output = result.stdout.strip()
-            if max_length and output.startswith("["):
-                return json.loads(output)
-            return output
-
-        @staticmethod
-        def loads_xml(sisl_input):
-            """Convert SISL to XML using sislc --loads --xml."""
-            if isinstance(sisl_input, list):
-                sisl_input = json.dumps(sisl_input)
-            result = subprocess.run(
-                [SISLC_PATH, "--loads", "--xml"],
-                input=sisl_input,
-                capture_output=True,
-                text=True
+    def loads_list(self, parts):
+        """Merge a list of SISL fragments into one object using sislc.
+
+        Over the REPL the fragments are sent length-prefixed with --parts,
+        so no JSON array has to be built; otherwise this is loads(parts).
+        """
+        if self.server is None:
+            return self.loads(parts)
+        payload = b"".join(
+            struct.pack(">I", len(data)) + data for data in (part.encode() for part in parts)
+        )
+        rc, stdout, stderr = self._run(["--loads", "--parts"], payload)
+        if rc != 0:
+            raise RuntimeError(f"sislc --loads --parts failed: {stderr.decode()}")
+        return json_loads(stdout)
+
+    def roundtrip(self, json_obj, sisl_input):
+        """Dump json_obj and load sisl_input in one batch.
+
+        Returns (sisl, obj): the SISL sislc produced for json_obj and the
+        object sislc parsed from sisl_input.
+        """
+        return self.roundtrip_many([(json_obj, sisl_input)])[0]
+
+    def roundtrip_many(self, pairs):
+        """Run roundtrip() for each (json_obj, sisl_input) pair in one batch.
+
+        Returns a list of (sisl, obj) tuples in the order of pairs.
+        """
+        return self.roundtrip_raw_many(
+            [(json_dumps(json_obj), sisl_input) for json_obj, sisl_input in pairs]
+        )
+
+    def roundtrip_raw_many(self, pairs):
+        """Like roundtrip_many(), but with JSON text already serialized."""
+        return [
+            self.roundtrip_result(json_str, sisl_input, dumps_response, loads_response)
+            for (json_str, sisl_input), (dumps_response, loads_response)
+            in zip(pairs, self.roundtrip_responses(pairs))
+        ]
+
+    def roundtrip_responses(self, pairs):
+        """Raw (dumps, loads) responses for each (json_str, sisl_input) pair.
+
+        Nothing is checked yet, so one failing pair does not hide the others;
+        pass each pair with its responses to roundtrip_result().
+        """
+        requests = []
+        for json_str, sisl_input in pairs:
+            requests.append((["--dumps"], json_str))
+            requests.append((["--loads"], sisl_input))
+        responses = self._run_many(requests)
+        return list(zip(responses[::2], responses[1::2]))
+
+    @staticmethod
+    def roundtrip_result(json_str, sisl_input, dumps_response, loads_response):
+        """(sisl, obj) from one pair's responses, raising if either step failed."""
+        dumps_rc, dumps_out, dumps_err = dumps_response
+        if dumps_rc != 0:
+            raise RuntimeError(
+                f"sislc --dumps failed on {json_str!r}: {dumps_err.decode()}"
             )
-            if result.returncode != 0:
-                raise RuntimeError(f"sislc --loads --xml failed: {result.stderr}")
-            return result.stdout
-
-        @staticmethod
-        def run_with_files(args, input_file=None, output_file=None, stdin_data=None):
-            """Run sislc with --input/--output file arguments.
-
-            Returns (returncode, stdout, stderr) tuple.
-            """
-            cmd = [SISLC_PATH] + args
-            if input_file:
-                cmd.extend(["--input", input_file])
-            if output_file:
-                cmd.extend(["--output", output_file])
-            result = subprocess.run(
-                cmd,
-                input=stdin_data,
-                capture_output=True,
-                text=True
+        loads_rc, loads_out, loads_err = loads_response
+        if loads_rc != 0:
+            raise RuntimeError(
+                f"sislc --loads failed on {sisl_input!r}: {loads_err.decode()}"
             )
-            return result.returncode, result.stdout, result.stderr
+        return dumps_out.decode(), json_loads(loads_out)
+
+    def loads_raw(self, sisl_input):
+        """Convert SISL to raw JSON string using sislc (no Python parse)."""
+        if isinstance(sisl_input, list):
+            sisl_input = json_dumps(sisl_input)
+        rc, stdout, stderr = self._run(["--loads"], sisl_input)
+        if rc != 0:
+            raise RuntimeError(f"sislc --loads failed: {stderr.decode()}")
+        return stdout.decode()
+
+    def dumps_raw(self, json_str, max_length=None):
+        """Convert raw JSON string to SISL using sislc."""
+        args = ["--dumps"]
+        if max_length:
+            args.extend(["--max-length", str(max_length)])
+        rc, stdout, stderr = self._run(args, json_str)
+        if rc != 0:
+            raise RuntimeError(f"sislc --dumps failed: {stderr.decode()}")
+        return stdout.decode()
+
+    def dumps_xml(self, xml_str, max_length=None, cache=True):
+        """Convert XML (str or bytes) to SISL using sislc --dumps --xml.
+
+        sislc is deterministic, so each distinct input is converted once
+        per session; failures are not cached and raise every time.
+        Pass cache=False to always run sislc (e.g. when timing it).
+        """
+        if not cache:
+            return self._dumps_xml(xml_str, max_length)
+        key = (xml_str, max_length)
+        result = self._dumps_xml_cache.get(key)
+        if result is None:
+            result = self._dumps_xml_cache[key] = self._dumps_xml(xml_str, max_length)
+        return result
+
+    def _dumps_xml(self, xml_str, max_length):
+        """dumps_xml without the cache."""
+        args = ["--dumps", "--xml"]
+        if max_length:
+            args.extend(["--max-length", str(max_length)])
+        rc, stdout, stderr = self._run(args, xml_str)
+        if rc != 0:
+            raise RuntimeError(f"sislc --dumps --xml failed: {stderr.decode()}")
+        output = stdout
+        if max_length and output.startswith(b"["):
+            return json_loads(output)
+        return output.decode()
+
+    def loads_xml(self, sisl_input):
+        """Convert SISL to XML using sislc --loads --xml."""
+        if isinstance(sisl_input, list):
+            sisl_input = json_dumps(sisl_input)
+        rc, stdout, stderr = self._run(["--loads", "--xml"], sisl_input)
+        if rc != 0:
+            raise RuntimeError(f"sislc --loads --xml failed: {stderr.decode()}")
+        return stdout.decode()
+
+    def assert_idempotent(self, xml_in):
+        """Assert an XML -> SISL -> XML -> SISL trip reproduces the first SISL.
+
+        This implies every later XML round trip is stable. A document with
+        no declaration gains a default one on the first trip, so give it one.
+        Returns the SISL for further checks.
+        """
+        sisl_out = self.dumps_xml(xml_in)
+        assert self.dumps_xml(self.loads_xml(sisl_out)) == sisl_out
+        return sisl_out
+
+    @staticmethod
+    def run_with_files(args, input_file=None, output_file=None, stdin_data=None):
+        """Run sislc with --input/--output file arguments.
+
+        Always spawns a real sislc process so the command-line interface
+        itself stays covered. Returns a Result of (rc, stdout, stderr),
+        with the output left as bytes.
+        """
+        cmd = [SISLC_PATH] + args
+        if input_file:
+            cmd.extend(["--input", input_file])
+        if output_file:
+            cmd.extend(["--output", output_file])
+        if isinstance(stdin_data, str):
+            stdin_data = stdin_data.encode()
+        result = subprocess.run(cmd, input=stdin_data, capture_output=True)
+        return Result(result.returncode, result.stdout, result.stderr)
+
+
+# pytest cache key for persisted pysisl.dumps results
+PYSISL_CACHE_KEY = "sislc/pysisl-dumps"
+
+
+def _pysisl_fingerprint():
+    """Identify the installed pysisl code, not just its version string.
+
+    Covers every module's size and mtime, so editing an editable or dev
+    install invalidates the persisted results.
+    """
+    digest = hashlib.sha256(importlib.metadata.version("pysisl").encode())
+    for path in sorted(pathlib.Path(pysisl.__file__).parent.glob("*.py")):
+        st = path.stat()
+        digest.update(f"{path.name}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class PysislHelper:
+    """Memoized pysisl conversions shared across the whole session.
+
+    pysisl is deterministic, so each distinct input is converted once.
+    Results are shared between callers and must not be mutated.
+    When given a pytest cache, dumps results are loaded from it and
+    saved back, so they carry over between test runs until pysisl changes
+    (see _pysisl_fingerprint) or `pytest --cache-clear` is run.
+    """
+
+    def __init__(self, cache=None):
+        self._cache = cache
+        self._dumps_cache = {}
+        if cache is not None:
+            self._fingerprint = _pysisl_fingerprint()
+            self._dumps_cache = self._stored_dumps()
+        self._dumps_dirty = False
+        self._loads_cache = {}
+
+    def _stored_dumps(self):
+        """Persisted dumps results, or {} if they came from other pysisl code."""
+        stored = self._cache.get(PYSISL_CACHE_KEY, {})
+        if stored.get("fingerprint") != self._fingerprint:
+            return {}
+        return stored["dumps"]
+
+    def py_dumps(self, obj, key=None, max_length=None):
+        """pysisl.dumps(obj, max_length=...), cached by the object's JSON text.
+
+        The key keeps key order, since it changes the SISL output. Pass key
+        when json.dumps(obj) is already known.
+        """
+        if key is None:
+            key = json.dumps(obj)
+        if max_length is not None:
+            # Unambiguous: no JSON text starts with digits then ":"
+            key = f"{max_length}:{key}"
+        try:
+            return self._dumps_cache[key]
+        except KeyError:
+            if max_length is None:
+                result = pysisl.dumps(obj)
+            else:
+                result = pysisl.dumps(obj, max_length=max_length)
+            self._dumps_cache[key] = result
+            self._dumps_dirty = True
+            return result
+
+    def save(self):
+        """Write new dumps results back to the pytest cache."""
+        if self._cache is not None and self._dumps_dirty:
+            lock_path = self._cache.mkdir("sislc") / "pysisl-dumps.lock"
+            with open(lock_path, "w") as lock:
+                # Under xdist each worker saves; merge under a lock so none
+                # drops the others'. Results from other pysisl code are
+                # dropped rather than merged.
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                merged = self._stored_dumps()
+                merged.update(self._dumps_cache)
+                self._cache.set(
+                    PYSISL_CACHE_KEY, {"fingerprint": self._fingerprint, "dumps": merged}
+                )
+            self._dumps_dirty = False
+
+    def py_loads(self, sisl_str):
+        """pysisl.loads(sisl_str), cached by the SISL text."""
+        try:
+            return self._loads_cache[sisl_str]
+        except KeyError:
+            result = self._loads_cache[sisl_str] = pysisl.loads(sisl_str)
+            return result
+
+
+class RoundtripBatch:
+    """sislc round trips for a fixed set of cases, run as one batch.
+
+    Each case starts with an (obj, json_str) pair, json_str being
+    json.dumps(obj); any further values are left to the test.
+    sislc dumps json_str and loads the pysisl encoding of obj. Index the
+    batch with json_str to get that case's (sisl, obj) result, or call
+    assert_roundtrip to check both directions against obj. A case whose
+    conversion failed raises only when it is looked up, so it fails its
+    own test rather than every test sharing the batch.
+    """
+
+    def __init__(self, sislc, pyhelper, cases):
+        self._pyhelper = pyhelper
+        pairs = [(json_str, pyhelper.py_dumps(obj, key=json_str)) for obj, json_str, *_ in cases]
+        self._responses = {
+            pair[0]: (pair, responses)
+            for pair, responses in zip(pairs, sislc.roundtrip_responses(pairs))
+        }
+
+    def __getitem__(self, json_str):
+        (_, sisl_input), (dumps_response, loads_response) = self._responses[json_str]
+        return SislcHelper.roundtrip_result(json_str, sisl_input, dumps_response, loads_response)
+
+    def assert_roundtrip(self, obj, json_str, **tolerance):
+        """Assert obj survives pysisl -> sislc and sislc -> pysisl unchanged.
+
+        Pass pytest.approx tolerances (abs=, rel=) to compare floats loosely.
+        """
+        expected = approx_deep(obj, **tolerance) if tolerance else obj
+        cpp_sisl, cpp_result = self[json_str]
+        assert cpp_result == expected
+        assert self._pyhelper.py_loads(cpp_sisl) == expected
+
+
+@pytest.fixture(scope="session")
+def _sislc_server(tmp_path_factory):
+    """Fixture providing a persistent sislc REPL worker (None if disabled).
+
+    Under pytest-xdist, all workers share one `sislc --server` instead.
+    """
+    if not USE_REPL:
+        yield None
+        return
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        # The base temp dir's parent is shared by every worker of this run
+        base_dir = str(tmp_path_factory.getbasetemp().parent)
+        sock, daemon = _sislc_daemon.connect_or_start(SISLC_PATH, base_dir)
+        server = SislcSocketClient(sock)
+        yield server
+        server.close()
+        if daemon is not None:
+            _sislc_daemon.stop(daemon, base_dir)
+        return
+    server = SislcServer(SISLC_PATH)
+    yield server
+    server.close()
+
+
+@pytest.fixture(scope="session")
+def sislc(_sislc_server):
+    """Fixture providing sislc helper functions."""
+    return SislcHelper(_sislc_server)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _sislc_warmup(sislc):
+    """Start sislc and send one dumps/loads pair before the first test.
+
+    The cold start (process launch, first page faults) is then charged
+    to session setup on each xdist worker, not to whichever test runs
+    first, which keeps per-test durations comparable.
+    """
+    sislc.loads(sislc.dumps({"_": 1}))
+
+
+if pytest_benchmark is None:
+    @pytest.fixture
+    def benchmark():
+        """Stand-in for pytest-benchmark's fixture: calls the function once."""
+        def run(func, *args, **kwargs):
+            return func(*args, **kwargs)
+        return run
+
+
+@pytest.fixture(scope="session")
+def pyhelper(request):
+    """Fixture providing cached pysisl conversions, persisted between runs."""
+    # config.cache is missing when the cacheprovider plugin is disabled
+    helper = PysislHelper(getattr(request.config, "cache", None))
+    yield helper
+    helper.save()
+
+
+@pytest.fixture(scope="session")
+def range100_obj():
+    """A 100-element array object and its JSON text, built once per session."""
+    obj = {"big": list(range(100))}
+    return obj, json.dumps(obj)
+
+
+@pytest.fixture(scope="session")
+def sample_tmp():
+    """A scratch directory for input/output files, shared by the session.
+
+    It lives on the /dev/shm tmpfs where available, so the file IO tests
+    never touch disk. Every session, including each xdist worker's, gets a
+    fresh uniquely named directory, so it never inherits a crashed run's files.
+    """
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        base = "/dev/shm"
+    else:
+        base = None
+    path = pathlib.Path(tempfile.mkdtemp(prefix="sislc_tests_", dir=base))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def roundtrip_batch(sislc, pyhelper):
+    """Fixture returning a factory that builds a RoundtripBatch from cases."""
+    def build(cases):
+        return RoundtripBatch(sislc, pyhelper, cases)
+    return build
+
 
-    return SislcHelper()
+@pytest.fixture(scope="class")
+def sislc_batched(request, roundtrip_batch):
+    """Round trips for every pytest.param in the test class's CASES, as one batch."""
+    return roundtrip_batch([case.values for case in request.cls.CASES])
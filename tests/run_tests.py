@@ -9,24 +9,30 @@ Usage:
     python run_tests.py --tb=short   # Short traceback on failures
 """
 
+import importlib.util
 import sys
-import subprocess
+
+import pytest
 
 
 def main():
     # Build pytest arguments
     args = [
-        "python3", "-m", "pytest",
         "-v",  # Verbose by default
         "--tb=short",  # Short tracebacks
     ]
 
+    # Every test is an independent round trip, so spread them across cores
+    # when pytest-xdist is available. loadscope keeps each test class on one
+    # worker, so its batch runs once.
+    if importlib.util.find_spec("xdist") is not None:
+        args.extend(["-n", "auto", "--dist=loadscope"])
+
     # Add any command-line arguments passed to this script
     args.extend(sys.argv[1:])
 
-    # Run from the tests directory
-    result = subprocess.run(args)
-    return result.returncode
+    # Run pytest in this interpreter rather than starting another one
+    return pytest.main(args)
 
 
 if __name__ == "__main__":
@@ -7,95 +7,49 @@ Tests for array (list) type conversions with various element types and nesting.
 import pytest
 import pysisl
 
+from _cases import case
 
-class TestSimpleArrays:
-    """Simple array conversions."""
 
-    def test_empty_array(self, sislc):
-        """Empty array."""
-        obj = {"items": []}
+SIMPLE_ARRAY_CASES = [
+    case({"items": []}, "empty"),
+    case({"items": [1]}, "single_element"),
+    case({"numbers": [1, 2, 3, 4, 5]}, "integers"),
+    case({"words": ["hello", "world", "test"]}, "strings"),
+    case({"flags": [True, False, True, False]}, "booleans"),
+]
 
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
 
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_single_element_array(self, sislc):
-        """Array with single element."""
-        obj = {"items": [1]}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_integer_array(self, sislc):
-        """Array of integers."""
-        obj = {"numbers": [1, 2, 3, 4, 5]}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_string_array(self, sislc):
-        """Array of strings."""
-        obj = {"words": ["hello", "world", "test"]}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_boolean_array(self, sislc):
-        """Array of booleans."""
-        obj = {"flags": [True, False, True, False]}
+class TestSimpleArrays:
+    """Simple array conversions."""
 
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
+    CASES = SIMPLE_ARRAY_CASES
 
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
+    @pytest.mark.parametrize("obj, pre_json", SIMPLE_ARRAY_CASES)
+    def test_simple_array(self, sislc_batched, obj, pre_json):
+        """Flat arrays of a single element type."""
+        sislc_batched.assert_roundtrip(obj, pre_json)
 
-    def test_float_array(self, sislc):
+    def test_float_array(self, sislc, pyhelper):
         """Array of floats."""
         obj = {"values": [1.1, 2.2, 3.3]}
 
-        py_sisl = pysisl.dumps(obj)
+        py_sisl = pyhelper.py_dumps(obj)
         cpp_result = sislc.loads(py_sisl)
-        # Compare with tolerance for floats
-        assert len(cpp_result["values"]) == 3
-        for i, expected in enumerate([1.1, 2.2, 3.3]):
-            assert abs(cpp_result["values"][i] - expected) < 0.001
+        assert cpp_result["values"] == pytest.approx([1.1, 2.2, 3.3], rel=1e-3)
 
         cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        for i, expected in enumerate([1.1, 2.2, 3.3]):
-            assert abs(py_result["values"][i] - expected) < 0.001
+        py_result = pyhelper.py_loads(cpp_sisl)
+        assert py_result["values"] == pytest.approx([1.1, 2.2, 3.3], rel=1e-3)
 
 
 class TestMixedArrays:
     """Arrays with mixed element types."""
 
-    def test_mixed_types_array(self, sislc):
+    def test_mixed_types_array(self, sislc, pyhelper):
         """Array with different types."""
         obj = {"mixed": ["string", 42, True, None]}
 
-        py_sisl = pysisl.dumps(obj)
+        py_sisl = pyhelper.py_dumps(obj)
         cpp_result = sislc.loads(py_sisl)
         assert cpp_result == obj
 
@@ -103,11 +57,11 @@ class TestMixedArrays:
         py_result = pysisl.loads(cpp_sisl)
         assert py_result == obj
 
-    def test_array_with_objects(self, sislc):
+    def test_array_with_objects(self, sislc, pyhelper):
         """Array containing objects."""
         obj = {"users": [{"name": "Alice"}, {"name": "Bob"}]}
 
-        py_sisl = pysisl.dumps(obj)
+        py_sisl = pyhelper.py_dumps(obj)
         cpp_result = sislc.loads(py_sisl)
         assert cpp_result == obj
 
@@ -119,11 +73,11 @@ class TestMixedArrays:
 class TestNestedArrays:
     """Nested array structures."""
 
-    def test_2d_array(self, sislc):
+    def test_2d_array(self, sislc, pyhelper):
         """Two-dimensional array (array of arrays)."""
         obj = {"matrix": [[1, 2], [3, 4], [5, 6]]}
 
-        py_sisl = pysisl.dumps(obj)
+        py_sisl = pyhelper.py_dumps(obj)
         cpp_result = sislc.loads(py_sisl)
         assert cpp_result == obj
 
@@ -131,11 +85,11 @@ class TestNestedArrays:
         py_result = pysisl.loads(cpp_sisl)
         assert py_result == obj
 
-    def test_3d_array(self, sislc):
+    def test_3d_array(self, sislc, pyhelper):
         """Three-dimensional array."""
         obj = {"cube": [[[1, 2], [3, 4]], [[5, 6], [7, 8]]]}
 
-        py_sisl = pysisl.dumps(obj)
+        py_sisl = pyhelper.py_dumps(obj)
         cpp_result = sislc.loads(py_sisl)
         assert cpp_result == obj
 
@@ -143,11 +97,11 @@ class TestNestedArrays:
         py_result = pysisl.loads(cpp_sisl)
         assert py_result == obj
 
-    def test_ragged_array(self, sislc):
+    def test_ragged_array(self, sislc, pyhelper):
         """Ragged array (different length subarrays)."""
         obj = {"ragged": [[1], [2, 3], [4, 5, 6]]}
 
-        py_sisl = pysisl.dumps(obj)
+        py_sisl = pyhelper.py_dumps(obj)
         cpp_result = sislc.loads(py_sisl)
         assert cpp_result == obj
 
@@ -155,11 +109,11 @@ class TestNestedArrays:
         py_result = pysisl.loads(cpp_sisl)
         assert py_result == obj
 
-    def test_deeply_nested_array(self, sislc):
+    def test_deeply_nested_array(self, sislc, pyhelper):
         """Deeply nested array structure."""
         obj = {"deep": [[[[1]]]]}
 
-        py_sisl = pysisl.dumps(obj)
+        py_sisl = pyhelper.py_dumps(obj)
         cpp_result = sislc.loads(py_sisl)
         assert cpp_result == obj
 
@@ -171,25 +125,25 @@ class TestNestedArrays:
 class TestLargeArrays:
     """Arrays with many elements."""
 
-    def test_100_element_array(self, sislc):
+    def test_100_element_array(self, sislc, pyhelper, range100_obj):
         """Array with 100 elements."""
-        obj = {"big": list(range(100))}
+        obj, obj_json = range100_obj
 
-        py_sisl = pysisl.dumps(obj)
+        py_sisl = pyhelper.py_dumps(obj, key=obj_json)
         cpp_result = sislc.loads(py_sisl)
         assert cpp_result == obj
 
-        cpp_sisl = sislc.dumps(obj)
+        cpp_sisl = sislc.dumps_raw(obj_json)
         # Note: pysisl may have lexicographic ordering issues with _10, _2 etc
         # so we just verify C++ round-trip works
         cpp_roundtrip = sislc.loads(cpp_sisl)
         assert cpp_roundtrip == obj
 
-    def test_array_of_empty_arrays(self, sislc):
+    def test_array_of_empty_arrays(self, sislc, pyhelper):
         """Array containing empty arrays."""
         obj = {"sparse": [[], [], []]}
 
-        py_sisl = pysisl.dumps(obj)
+        py_sisl = pyhelper.py_dumps(obj)
         cpp_result = sislc.loads(py_sisl)
         assert cpp_result == obj
 
@@ -5,218 +5,100 @@ Tests for object/dictionary type conversions with various nesting levels.
 """
 
 import pytest
-import pysisl
+
+from _cases import case
+
+
+SIMPLE_OBJECT_CASES = [
+    case({}, "empty"),
+    case({"key": "value"}, "single_key"),
+    case({"a": 1, "b": 2, "c": 3}, "multiple_keys"),
+]
+
+# Flat objects with floats, compared within abs=0.001
+FLOAT_OBJECT_CASES = [
+    case({
+        "string": "hello",
+        "integer": 42,
+        "float": 3.14,
+        "boolean": True,
+        "null": None
+    }, "mixed_value_types"),
+]
+
+NESTED_OBJECT_CASES = [
+    case({"outer": {"inner": "value"}}, "one_level"),
+    case({"a": {"b": {"c": "deep"}}}, "two_levels"),
+    case({"l1": {"l2": {"l3": {"l4": {"l5": "bottom"}}}}}, "five_levels"),
+    case({
+        "user": {"name": "Alice", "age": 30},
+        "address": {"city": "NYC", "zip": "10001"}
+    }, "nested_siblings"),
+]
+
+OBJECTS_WITH_ARRAYS_CASES = [
+    case({"numbers": [1, 2, 3]}, "array_value"),
+    case({
+        "data": {
+            "values": [1, 2, 3],
+            "labels": ["a", "b", "c"]
+        }
+    }, "nested_object_with_arrays"),
+]
+
+SPECIAL_KEY_CASES = [
+    case({"_private": "value"}, "underscore"),
+    case({"item1": "a", "item2": "b", "item3": "c"}, "numeric_suffix"),
+    case({"config.setting": "value"}, "dotted"),
+    case({"my-key": "value"}, "hyphenated"),
+    case({"a" * 100: "value"}, "long"),
+]
 
 
 class TestSimpleObjects:
     """Simple object conversions."""
 
-    def test_empty_object(self, sislc):
-        """Empty object."""
-        obj = {}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_single_key_object(self, sislc):
-        """Object with single key."""
-        obj = {"key": "value"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_multiple_keys_object(self, sislc):
-        """Object with multiple keys."""
-        obj = {"a": 1, "b": 2, "c": 3}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_mixed_value_types(self, sislc):
-        """Object with different value types."""
-        obj = {
-            "string": "hello",
-            "integer": 42,
-            "float": 3.14,
-            "boolean": True,
-            "null": None
-        }
+    CASES = SIMPLE_OBJECT_CASES + FLOAT_OBJECT_CASES
 
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result["string"] == "hello"
-        assert cpp_result["integer"] == 42
-        assert abs(cpp_result["float"] - 3.14) < 0.001
-        assert cpp_result["boolean"] == True
-        assert cpp_result["null"] == None
+    @pytest.mark.parametrize("obj, pre_json", SIMPLE_OBJECT_CASES)
+    def test_simple_object(self, sislc_batched, obj, pre_json):
+        """Flat objects, including the empty object."""
+        sislc_batched.assert_roundtrip(obj, pre_json)
 
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result["string"] == "hello"
-        assert py_result["integer"] == 42
-        assert abs(py_result["float"] - 3.14) < 0.001
-        assert py_result["boolean"] == True
-        assert py_result["null"] == None
+    @pytest.mark.parametrize("obj, pre_json", FLOAT_OBJECT_CASES)
+    def test_float_object(self, sislc_batched, obj, pre_json):
+        """Objects mixing a float with other value types."""
+        sislc_batched.assert_roundtrip(obj, pre_json, abs=0.001)
 
 
 class TestNestedObjects:
     """Nested object structures."""
 
-    def test_one_level_nesting(self, sislc):
-        """Object with one level of nesting."""
-        obj = {"outer": {"inner": "value"}}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_two_level_nesting(self, sislc):
-        """Object with two levels of nesting."""
-        obj = {"a": {"b": {"c": "deep"}}}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_deep_nesting(self, sislc):
-        """Object with deep nesting (5 levels)."""
-        obj = {"l1": {"l2": {"l3": {"l4": {"l5": "bottom"}}}}}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_multiple_nested_siblings(self, sislc):
-        """Object with multiple nested sibling objects."""
-        obj = {
-            "user": {"name": "Alice", "age": 30},
-            "address": {"city": "NYC", "zip": "10001"}
-        }
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
+    CASES = NESTED_OBJECT_CASES
 
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
+    @pytest.mark.parametrize("obj, pre_json", NESTED_OBJECT_CASES)
+    def test_nested_object(self, sislc_batched, obj, pre_json):
+        """Objects nested up to five levels deep."""
+        sislc_batched.assert_roundtrip(obj, pre_json)
 
 
 class TestObjectsWithArrays:
     """Objects containing arrays."""
 
-    def test_object_with_array_value(self, sislc):
-        """Object with array as value."""
-        obj = {"numbers": [1, 2, 3]}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_nested_object_with_arrays(self, sislc):
-        """Nested object containing arrays."""
-        obj = {
-            "data": {
-                "values": [1, 2, 3],
-                "labels": ["a", "b", "c"]
-            }
-        }
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
+    CASES = OBJECTS_WITH_ARRAYS_CASES
 
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
+    @pytest.mark.parametrize("obj, pre_json", OBJECTS_WITH_ARRAYS_CASES)
+    def test_object_with_arrays(self, sislc_batched, obj, pre_json):
+        """Objects holding arrays, directly or nested."""
+        sislc_batched.assert_roundtrip(obj, pre_json)
 
 
 class TestSpecialKeyNames:
     """Objects with special key names."""
 
-    def test_underscore_key(self, sislc):
-        """Key starting with underscore."""
-        obj = {"_private": "value"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_numeric_suffix_key(self, sislc):
-        """Key with numeric suffix."""
-        obj = {"item1": "a", "item2": "b", "item3": "c"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_dotted_key(self, sislc):
-        """Key containing dots."""
-        obj = {"config.setting": "value"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_hyphenated_key(self, sislc):
-        """Key containing hyphens."""
-        obj = {"my-key": "value"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_long_key(self, sislc):
-        """Very long key name."""
-        obj = {"a" * 100: "value"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
+    CASES = SPECIAL_KEY_CASES
 
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
+    @pytest.mark.parametrize("obj, pre_json", SPECIAL_KEY_CASES)
+    def test_special_key(self, sislc_batched, obj, pre_json):
+        """Keys with punctuation, digits or unusual length."""
+        sislc_batched.assert_roundtrip(obj, pre_json)
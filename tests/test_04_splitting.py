@@ -8,17 +8,43 @@ into multiple SISL strings.
 import pytest
 import pysisl
 import json
+from types import SimpleNamespace
+
+# Built once at import rather than in the test body
+_MANY_KEYS_OBJ = {f"key{i}": i for i in range(10)}
+
+# (obj, max_length) inputs whose pysisl splits are cached between runs
+SPLIT_TYPE_CASES = [
+    pytest.param({"x": 100, "y": 200, "z": 300}, 20, id="integers"),
+    pytest.param({"a": True, "b": False, "c": True}, 25, id="booleans"),
+    pytest.param({"x": "hello", "y": "world"}, 25, id="strings"),
+]
+
+
+def roundtrip_split(sislc, pyhelper, obj, max_length):
+    """Split obj with sislc and pysisl, then join both splits with sislc.
+
+    The two joins go to sislc as one pipelined batch. Returns a namespace
+    with cpp_parts, cpp_joined, py_parts and cpp_from_py.
+    """
+    cpp_parts = sislc.dumps(obj, max_length=max_length)
+    py_parts = pyhelper.py_dumps(obj, max_length=max_length)
+    cpp_joined, cpp_from_py = sislc.loads_many([cpp_parts, py_parts])
+    return SimpleNamespace(
+        cpp_parts=cpp_parts, cpp_joined=cpp_joined,
+        py_parts=py_parts, cpp_from_py=cpp_from_py,
+    )
 
 
 class TestBasicSplitting:
     """Basic splitting functionality."""
 
-    def test_no_split_needed(self, sislc):
+    def test_no_split_needed(self, sislc, pyhelper):
         """Small object that fits in max_length."""
         obj = {"a": 1}
 
         cpp_result = sislc.dumps(obj, max_length=100)
-        py_result = pysisl.dumps(obj, max_length=100)
+        py_result = pyhelper.py_dumps(obj, max_length=100)
 
         # C++ returns a single string when no split needed
         assert isinstance(cpp_result, str)
@@ -27,24 +53,24 @@ class TestBasicSplitting:
         # But the content should match
         assert cpp_result == py_result[0]
 
-    def test_simple_split(self, sislc):
+    def test_simple_split(self, sislc, pyhelper):
         """Simple object that needs splitting."""
         obj = {"abc": 2, "def": 3}
 
         cpp_parts = sislc.dumps(obj, max_length=20)
-        py_parts = pysisl.dumps(obj, max_length=20)
+        py_parts = pyhelper.py_dumps(obj, max_length=20)
 
         assert isinstance(cpp_parts, list)
         assert isinstance(py_parts, list)
         assert len(cpp_parts) == len(py_parts)
         assert cpp_parts == py_parts
 
-    def test_split_three_keys(self, sislc):
+    def test_split_three_keys(self, sislc, pyhelper):
         """Object with three keys that splits into three parts."""
         obj = {"a": 1, "b": 2, "c": 3}
 
         cpp_parts = sislc.dumps(obj, max_length=18)
-        py_parts = pysisl.dumps(obj, max_length=18)
+        py_parts = pyhelper.py_dumps(obj, max_length=18)
 
         assert len(cpp_parts) == len(py_parts)
         assert cpp_parts == py_parts
@@ -53,76 +79,43 @@ class TestBasicSplitting:
 class TestSplitRoundTrip:
     """Split then join round-trip tests."""
 
-    def test_split_join_simple(self, sislc):
+    def test_split_join_simple(self, sislc, pyhelper):
         """Split and join simple object."""
         obj = {"a": 1, "b": 2, "c": 3}
+        rt = roundtrip_split(sislc, pyhelper, obj, max_length=18)
 
         # C++ split -> C++ join
-        cpp_parts = sislc.dumps(obj, max_length=18)
-        cpp_joined = sislc.loads(cpp_parts)
-        assert cpp_joined == obj
-
+        assert rt.cpp_joined == obj
         # Python split -> C++ join
-        py_parts = pysisl.dumps(obj, max_length=18)
-        cpp_from_py = sislc.loads(py_parts)
-        assert cpp_from_py == obj
-
+        assert rt.cpp_from_py == obj
         # C++ split -> Python join
-        py_from_cpp = pysisl.loads(cpp_parts)
-        assert py_from_cpp == obj
+        assert pysisl.loads(rt.cpp_parts) == obj
 
-    def test_split_join_strings(self, sislc):
+    def test_split_join_strings(self, sislc, pyhelper):
         """Split and join object with string values."""
         obj = {"name": "Alice", "city": "NYC"}
+        rt = roundtrip_split(sislc, pyhelper, obj, max_length=25)
 
-        cpp_parts = sislc.dumps(obj, max_length=25)
-        cpp_joined = sislc.loads(cpp_parts)
-        assert cpp_joined == obj
+        assert rt.cpp_joined == obj
+        assert rt.cpp_from_py == obj
+        assert pysisl.loads(rt.cpp_parts) == obj
 
-        py_parts = pysisl.dumps(obj, max_length=25)
-        py_from_cpp = pysisl.loads(cpp_parts)
-        assert py_from_cpp == obj
-
-    def test_split_join_many_keys(self, sislc):
+    def test_split_join_many_keys(self, sislc, pyhelper):
         """Split and join object with many keys."""
-        obj = {f"key{i}": i for i in range(10)}
-
-        cpp_parts = sislc.dumps(obj, max_length=25)
-        cpp_joined = sislc.loads(cpp_parts)
-        assert cpp_joined == obj
+        rt = roundtrip_split(sislc, pyhelper, _MANY_KEYS_OBJ, max_length=25)
 
-        py_parts = pysisl.dumps(obj, max_length=25)
-        cpp_from_py = sislc.loads(py_parts)
-        assert cpp_from_py == obj
+        assert rt.cpp_joined == _MANY_KEYS_OBJ
+        assert rt.cpp_from_py == _MANY_KEYS_OBJ
 
 
 class TestSplitWithTypes:
     """Splitting with different value types."""
 
-    def test_split_integers(self, sislc):
-        """Split object with integer values."""
-        obj = {"x": 100, "y": 200, "z": 300}
-
-        cpp_parts = sislc.dumps(obj, max_length=20)
-        py_parts = pysisl.dumps(obj, max_length=20)
-
-        assert cpp_parts == py_parts
-
-    def test_split_booleans(self, sislc):
-        """Split object with boolean values."""
-        obj = {"a": True, "b": False, "c": True}
-
-        cpp_parts = sislc.dumps(obj, max_length=25)
-        py_parts = pysisl.dumps(obj, max_length=25)
-
-        assert cpp_parts == py_parts
-
-    def test_split_strings(self, sislc):
-        """Split object with string values."""
-        obj = {"x": "hello", "y": "world"}
-
-        cpp_parts = sislc.dumps(obj, max_length=25)
-        py_parts = pysisl.dumps(obj, max_length=25)
+    @pytest.mark.parametrize("obj, max_length", SPLIT_TYPE_CASES)
+    def test_split_matches_pysisl(self, sislc, pyhelper, obj, max_length):
+        """sislc splits each value type exactly as pysisl does."""
+        cpp_parts = sislc.dumps(obj, max_length=max_length)
+        py_parts = pyhelper.py_dumps(obj, max_length=max_length)
 
         assert cpp_parts == py_parts
 
@@ -130,14 +123,14 @@ class TestSplitWithTypes:
 class TestSplitEdgeCases:
     """Edge cases for splitting."""
 
-    def test_exact_fit(self, sislc):
+    def test_exact_fit(self, sislc, pyhelper):
         """Object that exactly fits max_length."""
         obj = {"a": 1}
-        sisl = pysisl.dumps(obj)
+        sisl = pyhelper.py_dumps(obj)
         exact_length = len(sisl)
 
         cpp_result = sislc.dumps(obj, max_length=exact_length)
-        py_result = pysisl.dumps(obj, max_length=exact_length)
+        py_result = pyhelper.py_dumps(obj, max_length=exact_length)
 
         # C++ returns a single string when no split needed
         assert isinstance(cpp_result, str)
@@ -145,25 +138,24 @@ class TestSplitEdgeCases:
         assert isinstance(py_result, list)
         assert len(py_result) == 1
 
-    def test_one_byte_over(self, sislc):
+    def test_one_byte_over(self, sislc, pyhelper):
         """Object one byte over max_length."""
         obj = {"ab": 1, "cd": 2}
-        sisl = pysisl.dumps(obj)
+        sisl = pyhelper.py_dumps(obj)
         length_minus_one = len(sisl) - 1
 
         cpp_parts = sislc.dumps(obj, max_length=length_minus_one)
-        py_parts = pysisl.dumps(obj, max_length=length_minus_one)
+        py_parts = pyhelper.py_dumps(obj, max_length=length_minus_one)
 
         # Should split
         assert isinstance(cpp_parts, list)
         assert isinstance(py_parts, list)
 
-    def test_split_preserves_order(self, sislc):
+    def test_split_preserves_order(self, sislc, pyhelper):
         """Splitting preserves key order when joined."""
         obj = {"first": 1, "second": 2, "third": 3}
 
-        cpp_parts = sislc.dumps(obj, max_length=22)
-        cpp_joined = sislc.loads(cpp_parts)
+        rt = roundtrip_split(sislc, pyhelper, obj, max_length=22)
 
         # Check that keys are in original order
-        assert list(cpp_joined.keys()) == ["first", "second", "third"]
+        assert list(rt.cpp_joined.keys()) == ["first", "second", "third"]
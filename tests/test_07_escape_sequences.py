@@ -6,248 +6,96 @@ Covers: \", \\, \r, \t, \n, \xHH, \uHHHH, \UHHHHHHHH
 """
 
 import pytest
-import pysisl
+
+from _cases import case
+
+BASIC_ESCAPE_CASES = [
+    case({"text": 'He said "hello"'}, "escaped_quote"),
+    case({"path": "C:\\Users\\name"}, "escaped_backslash"),
+    case({"text": "line1\rline2"}, "carriage_return"),
+    case({"text": "col1\tcol2\tcol3"}, "tab"),
+    case({"text": "line1\nline2\nline3"}, "newline"),
+]
+
+COMBINED_ESCAPE_CASES = [
+    case({"path": "C:\\Program Files\\App\\config.ini"}, "windows_path"),
+    case({"text": "Header:\n\tItem 1\n\tItem 2\n\tItem 3"}, "multiline_with_tabs"),
+    case({"json": '{"key": "value"}'}, "quoted_string_in_text"),
+    case({"text": "line1\r\nline2\r\nline3"}, "crlf"),
+    case({"text": "quote:\" backslash:\\ tab:\t newline:\n cr:\r"}, "all_basic_escapes"),
+]
+
+SPECIAL_CHARACTER_CASES = [
+    case({"text": ""}, "empty_string"),
+    case({"text": '""'}, "only_quotes"),
+    # Runs of escapable characters, long enough to cross any chunking in
+    # the escaper (3 reproduces the original fixed-length cases)
+    *[case({"text": "\\" * n}, f"only_backslashes_{n}") for n in (1, 3, 8, 64)],
+    *[case({"text": '"\\' * n}, f"alternating_quotes_backslashes_{n}") for n in (1, 3, 8, 64)],
+    # Bytes escaped as \xHH, and the edges of the printable run (0x20-0x7E)
+    case({"text": "\x01"}, "control_0x01"),
+    case({"text": "\x1f"}, "control_0x1f"),
+    case({"text": "\x7f"}, "delete_0x7f"),
+    case({"text": " printable run ~\x7f"}, "run_ends_at_0x7f"),
+    case({"text": "a\x00b\x01c"}, "controls_between_runs"),
+]
+
+REAL_WORLD_ESCAPE_CASES = [
+    case({"query": "SELECT * FROM users WHERE name = 'John'"}, "sql_query"),
+    case({"pattern": "^\\d{3}-\\d{4}$"}, "regex_pattern"),
+    case({"data": '{"name": "test", "value": 123}'}, "json_string"),
+    case({"code": 'print("Hello\\nWorld")'}, "code_snippet"),
+    case({"format": "[%Y-%m-%d %H:%M:%S]\t%level\t%message"}, "log_format"),
+]
 
 
 class TestBasicEscapes:
     """Basic escape sequences."""
 
-    def test_escaped_quote(self, sislc):
-        """String with escaped double quote."""
-        obj = {"text": 'He said "hello"'}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_escaped_backslash(self, sislc):
-        """String with escaped backslash."""
-        obj = {"path": "C:\\Users\\name"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_carriage_return(self, sislc):
-        """String with carriage return."""
-        obj = {"text": "line1\rline2"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_tab(self, sislc):
-        """String with tab character."""
-        obj = {"text": "col1\tcol2\tcol3"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
+    CASES = BASIC_ESCAPE_CASES
 
-    def test_newline(self, sislc):
-        """String with newline."""
-        obj = {"text": "line1\nline2\nline3"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
+    @pytest.mark.parametrize("obj, pre_json", BASIC_ESCAPE_CASES)
+    def test_basic_escape(self, sislc_batched, obj, pre_json):
+        """Single escape sequences."""
+        sislc_batched.assert_roundtrip(obj, pre_json)
 
 
 class TestCombinedEscapes:
     """Multiple escape sequences combined."""
 
-    def test_windows_path(self, sislc):
-        """Windows-style path with backslashes."""
-        obj = {"path": "C:\\Program Files\\App\\config.ini"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_multiline_with_tabs(self, sislc):
-        """Multiline text with tabs."""
-        obj = {"text": "Header:\n\tItem 1\n\tItem 2\n\tItem 3"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_quoted_string_in_text(self, sislc):
-        """Text containing quoted strings."""
-        obj = {"json": '{"key": "value"}'}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_crlf(self, sislc):
-        """Windows-style line endings (CRLF)."""
-        obj = {"text": "line1\r\nline2\r\nline3"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
+    CASES = COMBINED_ESCAPE_CASES
 
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_all_basic_escapes(self, sislc):
-        """String with all basic escape types."""
-        obj = {"text": "quote:\" backslash:\\ tab:\t newline:\n cr:\r"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
+    @pytest.mark.parametrize("obj, pre_json", COMBINED_ESCAPE_CASES)
+    def test_combined_escapes(self, sislc_batched, obj, pre_json):
+        """Several escape sequences in one string."""
+        sislc_batched.assert_roundtrip(obj, pre_json)
 
 
 class TestSpecialCharacters:
     """Special and control characters."""
 
-    def test_empty_string(self, sislc):
-        """Empty string (no escapes needed)."""
-        obj = {"text": ""}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_only_quotes(self, sislc):
-        """String that is only quotes."""
-        obj = {"text": '""'}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_only_backslashes(self, sislc):
-        """String that is only backslashes."""
-        obj = {"text": "\\\\\\"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_alternating_quotes_backslashes(self, sislc):
-        """Alternating quotes and backslashes."""
-        obj = {"text": '"\\"\\"\\'}
+    CASES = SPECIAL_CHARACTER_CASES
 
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
+    @pytest.mark.parametrize("obj, pre_json", SPECIAL_CHARACTER_CASES)
+    def test_special_characters(self, sislc_batched, obj, pre_json):
+        """Empty strings, escapable runs and control bytes."""
+        sislc_batched.assert_roundtrip(obj, pre_json)
 
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
+    @pytest.mark.parametrize("obj, pre_json", SPECIAL_CHARACTER_CASES)
+    def test_escaped_text_matches_pysisl(self, sislc_batched, pyhelper, obj, pre_json):
+        """sislc writes the same escape sequences as pysisl."""
+        cpp_sisl, _ = sislc_batched[pre_json]
+        assert cpp_sisl == pyhelper.py_dumps(obj, key=pre_json)
 
 
 class TestRealWorldEscapes:
     """Real-world scenarios requiring escapes."""
 
-    def test_sql_query(self, sislc):
-        """SQL query with quotes."""
-        obj = {"query": "SELECT * FROM users WHERE name = 'John'"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_regex_pattern(self, sislc):
-        """Regex pattern with backslashes."""
-        obj = {"pattern": "^\\d{3}-\\d{4}$"}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_json_string(self, sislc):
-        """JSON embedded in string."""
-        obj = {"data": '{"name": "test", "value": 123}'}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
-
-    def test_code_snippet(self, sislc):
-        """Code snippet with various escapes."""
-        obj = {"code": 'print("Hello\\nWorld")'}
-
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
-
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
+    CASES = REAL_WORLD_ESCAPE_CASES
 
-    def test_log_format(self, sislc):
-        """Log format string."""
-        obj = {"format": "[%Y-%m-%d %H:%M:%S]\t%level\t%message"}
+    @pytest.mark.parametrize("obj, pre_json", REAL_WORLD_ESCAPE_CASES)
+    def test_real_world(self, sislc_batched, obj, pre_json):
+        """Real-world strings full of quotes and backslashes."""
+        sislc_batched.assert_roundtrip(obj, pre_json)
 
-        py_sisl = pysisl.dumps(obj)
-        cpp_result = sislc.loads(py_sisl)
-        assert cpp_result == obj
 
-        cpp_sisl = sislc.dumps(obj)
-        py_result = pysisl.loads(cpp_sisl)
-        assert py_result == obj
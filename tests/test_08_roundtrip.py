@@ -9,55 +9,34 @@ import pytest
 import pysisl
 import json
 
+# Built once at import rather than in the test bodies
+_LARGE_ARRAY_OBJ = {"numbers": list(range(100))}
+_MANY_KEYS_OBJ = {f"key{i}": f"value{i}" for i in range(50)}
 
-class TestSimpleRoundTrips:
-    """Simple round-trip tests."""
+# One object per value type for sislc's own dumps -> loads round trip
+CPP_ROUNDTRIP_CASES = [
+    pytest.param({"key": "value"}, id="string"),
+    pytest.param({"num": 42}, id="integer"),
+    pytest.param({"val": 3.14159}, id="float"),
+    pytest.param({"flag": True}, id="boolean"),
+    pytest.param({"empty": None}, id="null"),
+    pytest.param({"items": [1, 2, 3]}, id="array"),
+    pytest.param({"outer": {"inner": "value"}}, id="nested_object"),
+]
 
-    def test_cpp_roundtrip_string(self, sislc):
-        """C++ round-trip for string."""
-        original = {"key": "value"}
-        sisl = sislc.dumps(original)
-        result = sislc.loads(sisl)
-        assert result == original
 
-    def test_cpp_roundtrip_integer(self, sislc):
-        """C++ round-trip for integer."""
-        original = {"num": 42}
-        sisl = sislc.dumps(original)
-        result = sislc.loads(sisl)
-        assert result == original
+def cpp_py_cpp(sislc, pyhelper, obj):
+    """obj after sislc dumps, pysisl loads, pysisl dumps and sislc loads."""
+    py_json = pyhelper.py_loads(sislc.dumps(obj))
+    return sislc.loads(pyhelper.py_dumps(py_json))
 
-    def test_cpp_roundtrip_float(self, sislc):
-        """C++ round-trip for float."""
-        original = {"val": 3.14159}
-        sisl = sislc.dumps(original)
-        result = sislc.loads(sisl)
-        assert abs(result["val"] - original["val"]) < 0.00001
 
-    def test_cpp_roundtrip_boolean(self, sislc):
-        """C++ round-trip for boolean."""
-        original = {"flag": True}
-        sisl = sislc.dumps(original)
-        result = sislc.loads(sisl)
-        assert result == original
-
-    def test_cpp_roundtrip_null(self, sislc):
-        """C++ round-trip for null."""
-        original = {"empty": None}
-        sisl = sislc.dumps(original)
-        result = sislc.loads(sisl)
-        assert result == original
-
-    def test_cpp_roundtrip_array(self, sislc):
-        """C++ round-trip for array."""
-        original = {"items": [1, 2, 3]}
-        sisl = sislc.dumps(original)
-        result = sislc.loads(sisl)
-        assert result == original
+class TestSimpleRoundTrips:
+    """Simple round-trip tests."""
 
-    def test_cpp_roundtrip_nested_object(self, sislc):
-        """C++ round-trip for nested object."""
-        original = {"outer": {"inner": "value"}}
+    @pytest.mark.parametrize("original", CPP_ROUNDTRIP_CASES)
+    def test_cpp_roundtrip(self, sislc, original):
+        """sislc loads back exactly what it dumped, floats included."""
         sisl = sislc.dumps(original)
         result = sislc.loads(sisl)
         assert result == original
@@ -66,41 +45,34 @@ class TestSimpleRoundTrips:
 class TestCrossImplementationRoundTrips:
     """Cross-implementation round-trips."""
 
-    def test_py_to_cpp_to_py(self, sislc):
+    def test_py_to_cpp_to_py(self, sislc, pyhelper):
         """Python -> C++ -> Python round-trip."""
         original = {"name": "test", "values": [1, 2, 3]}
 
-        py_sisl = pysisl.dumps(original)
+        py_sisl = pyhelper.py_dumps(original)
         cpp_json = sislc.loads(py_sisl)
         cpp_sisl = sislc.dumps(cpp_json)
         final = pysisl.loads(cpp_sisl)
 
         assert final == original
 
-    def test_cpp_to_py_to_cpp(self, sislc):
+    def test_cpp_to_py_to_cpp(self, sislc, pyhelper):
         """C++ -> Python -> C++ round-trip."""
         original = {"name": "test", "values": [1, 2, 3]}
 
-        cpp_sisl = sislc.dumps(original)
-        py_json = pysisl.loads(cpp_sisl)
-        py_sisl = pysisl.dumps(py_json)
-        final = sislc.loads(py_sisl)
-
-        assert final == original
+        assert cpp_py_cpp(sislc, pyhelper, original) == original
 
-    def test_multiple_cross_trips(self, sislc):
-        """Multiple cross-implementation round-trips."""
+    def test_multiple_cross_trips(self, sislc, pyhelper):
+        """Repeated cross-implementation round-trips cycle back to the start."""
         original = {"data": {"items": [1, 2, 3], "count": 3}}
 
-        current = original
-        for _ in range(5):
-            cpp_sisl = sislc.dumps(current)
-            py_json = pysisl.loads(cpp_sisl)
-            py_sisl = pysisl.dumps(py_json)
-            cpp_json = sislc.loads(py_sisl)
-            current = cpp_json
-
-        assert current == original
+        # Each cycle must be lossless. pysisl.loads reverses key order, so
+        # the second cycle lands back on the original exactly, key order
+        # included; any further cycles would only repeat these two.
+        first = cpp_py_cpp(sislc, pyhelper, original)
+        assert first == original
+        second = cpp_py_cpp(sislc, pyhelper, first)
+        assert json.dumps(second) == json.dumps(original)
 
 
 class TestSplitJoinRoundTrips:
@@ -116,11 +88,11 @@ class TestSplitJoinRoundTrips:
 
         assert result == original
 
-    def test_py_split_cpp_join(self, sislc):
+    def test_py_split_cpp_join(self, sislc, pyhelper):
         """Python split then C++ join round-trip."""
         original = {"a": 1, "b": 2, "c": 3, "d": 4}
 
-        parts = pysisl.dumps(original, max_length=20)
+        parts = pyhelper.py_dumps(original, max_length=20)
         result = sislc.loads(parts)
 
         assert result == original
@@ -134,14 +106,14 @@ class TestSplitJoinRoundTrips:
 
         assert result == original
 
-    def test_cross_split_join_multiple(self, sislc):
+    def test_cross_split_join_multiple(self, sislc, pyhelper):
         """Multiple cross-implementation split/join cycles."""
         original = {"x": 10, "y": 20, "z": 30}
 
         # C++ split -> Python join -> Python split -> C++ join
         cpp_parts = sislc.dumps(original, max_length=20)
         py_json = pysisl.loads(cpp_parts)
-        py_parts = pysisl.dumps(py_json, max_length=20)
+        py_parts = pyhelper.py_dumps(py_json, max_length=20)
         final = sislc.loads(py_parts)
 
         assert final == original
@@ -150,7 +122,7 @@ class TestSplitJoinRoundTrips:
 class TestComplexRoundTrips:
     """Round-trips with complex data structures."""
 
-    def test_deeply_nested_roundtrip(self, sislc):
+    def test_deeply_nested_roundtrip(self, sislc, pyhelper):
         """Round-trip for deeply nested structure."""
         original = {
             "level1": {
@@ -164,14 +136,9 @@ class TestComplexRoundTrips:
             }
         }
 
-        cpp_sisl = sislc.dumps(original)
-        py_json = pysisl.loads(cpp_sisl)
-        py_sisl = pysisl.dumps(py_json)
-        result = sislc.loads(py_sisl)
+        assert cpp_py_cpp(sislc, pyhelper, original) == original
 
-        assert result == original
-
-    def test_mixed_types_roundtrip(self, sislc):
+    def test_mixed_types_roundtrip(self, sislc, pyhelper):
         """Round-trip for structure with mixed types."""
         original = {
             "string": "hello",
@@ -182,31 +149,36 @@ class TestComplexRoundTrips:
             "object": {"nested": "value"}
         }
 
-        cpp_sisl = sislc.dumps(original)
-        py_json = pysisl.loads(cpp_sisl)
-        py_sisl = pysisl.dumps(py_json)
-        result = sislc.loads(py_sisl)
-
-        assert result == original
+        assert cpp_py_cpp(sislc, pyhelper, original) == original
 
     def test_large_array_roundtrip(self, sislc):
         """Round-trip for large array."""
-        original = {"numbers": list(range(100))}
+        original = _LARGE_ARRAY_OBJ
 
         cpp_sisl = sislc.dumps(original)
         result = sislc.loads(cpp_sisl)
 
         assert result == original
 
-    def test_many_keys_roundtrip(self, sislc):
+    def test_many_keys_roundtrip(self, sislc, pyhelper):
         """Round-trip for object with many keys."""
-        original = {f"key{i}": f"value{i}" for i in range(50)}
+        original = _MANY_KEYS_OBJ
 
-        py_sisl = pysisl.dumps(original)
+        py_sisl = pyhelper.py_dumps(original)
         result = sislc.loads(py_sisl)
 
+        # A missing or misspelt key fails here with a short key-set diff
+        assert result.keys() == original.keys()
         assert result == original
 
+    def test_large_batch_roundtrip(self, sislc):
+        """A pipelined batch bigger than the worker's pipe buffers completes."""
+        originals = [{"k": f"{i}" + "x" * 1000} for i in range(150)]
+
+        results = sislc.loads_many(sislc.dumps_many(originals))
+
+        assert results == originals
+
 
 class TestEdgeCaseRoundTrips:
     """Round-trips for edge cases."""
@@ -238,16 +210,11 @@ class TestEdgeCaseRoundTrips:
 
         assert result == original
 
-    def test_special_chars_roundtrip(self, sislc):
+    def test_special_chars_roundtrip(self, sislc, pyhelper):
         """Round-trip for strings with special characters."""
         original = {"text": 'Hello "World"\nNew\tLine\\Path'}
 
-        cpp_sisl = sislc.dumps(original)
-        py_json = pysisl.loads(cpp_sisl)
-        py_sisl = pysisl.dumps(py_json)
-        result = sislc.loads(py_sisl)
-
-        assert result == original
+        assert cpp_py_cpp(sislc, pyhelper, original) == original
 
     def test_large_integer_roundtrip(self, sislc):
         """Round-trip for large integers."""
@@ -5,223 +5,144 @@ Tests that verify the exact SISL string format matches between implementations.
 These tests ensure canonical formatting is identical.
 """
 
+import re
+
 import pytest
-import pysisl
+
+# Objects whose SISL encodings the tests below check, by name
+FORMAT_CASES = {
+    "simple_string": {"hello": "world"},
+    "integer": {"count": 42},
+    "boolean_true": {"flag": True},
+    "boolean_false": {"flag": False},
+    "null": {"empty": None},
+    "simple_list": {"items": [1, 2, 3]},
+    "single_element_list": {"items": [42]},
+    "empty_list": {"items": []},
+    "nested_object": {"outer": {"inner": "value"}},
+    "deeply_nested": {"a": {"b": {"c": 1}}},
+    "two_keys": {"a": 1, "b": 2},
+    "three_keys": {"x": "hello", "y": 42, "z": True},
+    "mixed_types": {"str": "text", "num": 1, "bool": True, "nil": None},
+    "documented_example_2": {"field_one": [1, 2, 3]},
+    "documented_example_3": {"field_one": {"key_one": "teststring"}},
+    "spacing": {"key": "value", "a": 1, "b": {"c": [1, 2]}},
+}
+
+# The exact SISL both implementations must produce, by FORMAT_CASES name
+_EXPECTED = {
+    "simple_string": '{hello: !str "world"}',
+    "integer": '{count: !int "42"}',
+    "boolean_true": '{flag: !bool "true"}',
+    "boolean_false": '{flag: !bool "false"}',
+    "null": '{empty: !null ""}',
+    "simple_list": '{items: !list {_0: !int "1", _1: !int "2", _2: !int "3"}}',
+    "single_element_list": '{items: !list {_0: !int "42"}}',
+    "empty_list": '{items: !list {}}',
+    "nested_object": '{outer: !obj {inner: !str "value"}}',
+    "deeply_nested": '{a: !obj {b: !obj {c: !int "1"}}}',
+    "two_keys": '{a: !int "1", b: !int "2"}',
+    "documented_example_2": '{field_one: !list {_0: !int "1", _1: !int "2", _2: !int "3"}}',
+    "documented_example_3": '{field_one: !obj {key_one: !str "teststring"}}',
+}
+
+# Matches any spacing mistake: a colon, type tag or comma not followed by
+# exactly one space and the token that must come next. The spacing case
+# has no colons or commas inside its string values.
+_SPACING_ERROR_RE = re.compile(r':(?! !)|!\w+\b(?! ["{])|,(?! \w)')
+
+
+@pytest.fixture(scope="module")
+def exact_format(sislc, pyhelper):
+    """(sislc SISL, pysisl SISL) for every FORMAT_CASES entry, by name.
+
+    sislc dumps all the objects in one pipelined batch.
+    """
+    cpp_results = sislc.dumps_many(list(FORMAT_CASES.values()))
+    return {
+        name: (cpp_sisl, pyhelper.py_dumps(obj))
+        for (name, obj), cpp_sisl in zip(FORMAT_CASES.items(), cpp_results)
+    }
 
 
 class TestExactStringFormat:
     """Tests for exact string format matching."""
 
-    def test_simple_string_format(self, sislc):
-        """Exact format for simple string."""
-        obj = {"hello": "world"}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
-
-        assert cpp_sisl == py_sisl
-        assert cpp_sisl == '{hello: !str "world"}'
-
-    def test_integer_format(self, sislc):
-        """Exact format for integer."""
-        obj = {"count": 42}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
-
-        assert cpp_sisl == py_sisl
-        assert cpp_sisl == '{count: !int "42"}'
-
-    def test_boolean_true_format(self, sislc):
-        """Exact format for boolean true."""
-        obj = {"flag": True}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
-
-        assert cpp_sisl == py_sisl
-        assert cpp_sisl == '{flag: !bool "true"}'
-
-    def test_boolean_false_format(self, sislc):
-        """Exact format for boolean false."""
-        obj = {"flag": False}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
+    @pytest.mark.parametrize("name", [
+        "simple_string", "integer", "boolean_true", "boolean_false", "null",
+    ])
+    def test_scalar_format(self, exact_format, name):
+        """Exact format for each scalar type."""
+        cpp_sisl, py_sisl = exact_format[name]
 
         assert cpp_sisl == py_sisl
-        assert cpp_sisl == '{flag: !bool "false"}'
-
-    def test_null_format(self, sislc):
-        """Exact format for null."""
-        obj = {"empty": None}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
-
-        assert cpp_sisl == py_sisl
-        assert cpp_sisl == '{empty: !null ""}'
+        assert cpp_sisl == _EXPECTED[name]
 
 
 class TestListFormat:
     """Tests for exact list format matching."""
 
-    def test_simple_list_format(self, sislc):
-        """Exact format for simple list."""
-        obj = {"items": [1, 2, 3]}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
-
-        assert cpp_sisl == py_sisl
-        expected = '{items: !list {_0: !int "1", _1: !int "2", _2: !int "3"}}'
-        assert cpp_sisl == expected
-
-    def test_single_element_list_format(self, sislc):
-        """Exact format for single element list."""
-        obj = {"items": [42]}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
-
-        assert cpp_sisl == py_sisl
-        assert cpp_sisl == '{items: !list {_0: !int "42"}}'
-
-    def test_empty_list_format(self, sislc):
-        """Exact format for empty list."""
-        obj = {"items": []}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
+    @pytest.mark.parametrize("name", ["simple_list", "single_element_list", "empty_list"])
+    def test_list_format(self, exact_format, name):
+        """Exact format for lists of zero, one and several elements."""
+        cpp_sisl, py_sisl = exact_format[name]
 
         assert cpp_sisl == py_sisl
-        assert cpp_sisl == '{items: !list {}}'
+        assert cpp_sisl == _EXPECTED[name]
 
 
 class TestNestedObjectFormat:
     """Tests for exact nested object format matching."""
 
-    def test_nested_object_format(self, sislc):
-        """Exact format for nested object."""
-        obj = {"outer": {"inner": "value"}}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
-
-        assert cpp_sisl == py_sisl
-        expected = '{outer: !obj {inner: !str "value"}}'
-        assert cpp_sisl == expected
-
-    def test_deeply_nested_format(self, sislc):
-        """Exact format for deeply nested object."""
-        obj = {"a": {"b": {"c": 1}}}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
+    @pytest.mark.parametrize("name", ["nested_object", "deeply_nested"])
+    def test_nested_object_format(self, exact_format, name):
+        """Exact format for objects nested one and two levels deep."""
+        cpp_sisl, py_sisl = exact_format[name]
 
         assert cpp_sisl == py_sisl
-        expected = '{a: !obj {b: !obj {c: !int "1"}}}'
-        assert cpp_sisl == expected
+        assert cpp_sisl == _EXPECTED[name]
 
 
 class TestMultipleKeysFormat:
     """Tests for exact format with multiple keys."""
 
-    def test_two_keys_format(self, sislc):
+    def test_two_keys_format(self, exact_format):
         """Exact format for object with two keys."""
-        obj = {"a": 1, "b": 2}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
-
-        assert cpp_sisl == py_sisl
-        expected = '{a: !int "1", b: !int "2"}'
-        assert cpp_sisl == expected
-
-    def test_three_keys_format(self, sislc):
-        """Exact format for object with three keys."""
-        obj = {"x": "hello", "y": 42, "z": True}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
+        cpp_sisl, py_sisl = exact_format["two_keys"]
 
         assert cpp_sisl == py_sisl
+        assert cpp_sisl == _EXPECTED["two_keys"]
 
-    def test_mixed_types_format(self, sislc):
-        """Exact format for mixed types."""
-        obj = {"str": "text", "num": 1, "bool": True, "nil": None}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
+    @pytest.mark.parametrize("name", ["three_keys", "mixed_types"])
+    def test_matches_pysisl(self, exact_format, name):
+        """Objects mixing value types encode as pysisl does."""
+        cpp_sisl, py_sisl = exact_format[name]
 
         assert cpp_sisl == py_sisl
 
 
 class TestDocumentedExamplesFormat:
-    """Tests for exact format from documentation."""
+    """Tests for exact format from documentation.
 
-    def test_documented_example_1(self, sislc):
-        """First documented example: {"hello": "world"}"""
-        obj = {"hello": "world"}
+    The first documented example, {"hello": "world"}, is
+    test_scalar_format[simple_string].
+    """
 
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
+    @pytest.mark.parametrize("name", ["documented_example_2", "documented_example_3"])
+    def test_documented_example(self, exact_format, name):
+        """Both implementations produce the documented SISL."""
+        cpp_sisl, py_sisl = exact_format[name]
 
-        expected = '{hello: !str "world"}'
-        assert cpp_sisl == expected
-        assert py_sisl == expected
-
-    def test_documented_example_2(self, sislc):
-        """Second documented example: list encoding"""
-        obj = {"field_one": [1, 2, 3]}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
-
-        expected = '{field_one: !list {_0: !int "1", _1: !int "2", _2: !int "3"}}'
-        assert cpp_sisl == expected
-        assert py_sisl == expected
-
-    def test_documented_example_3(self, sislc):
-        """Third documented example: nested object"""
-        obj = {"field_one": {"key_one": "teststring"}}
-
-        cpp_sisl = sislc.dumps(obj)
-        py_sisl = pysisl.dumps(obj)
-
-        expected = '{field_one: !obj {key_one: !str "teststring"}}'
-        assert cpp_sisl == expected
-        assert py_sisl == expected
+        assert cpp_sisl == _EXPECTED[name]
+        assert py_sisl == _EXPECTED[name]
 
 
 class TestSpacingFormat:
     """Tests for exact spacing in format."""
 
-    def test_spacing_after_colon(self, sislc):
-        """Verify single space after colon."""
-        obj = {"key": "value"}
-
-        cpp_sisl = sislc.dumps(obj)
-
-        # Should have exactly one space after colon
-        assert ": !" in cpp_sisl
-        assert ":  !" not in cpp_sisl  # No double space
-
-    def test_spacing_after_type(self, sislc):
-        """Verify single space after type."""
-        obj = {"key": "value"}
-
-        cpp_sisl = sislc.dumps(obj)
-
-        # Should have exactly one space after !str
-        assert '!str "' in cpp_sisl
-        assert '!str  "' not in cpp_sisl  # No double space
-
-    def test_comma_spacing(self, sislc):
-        """Verify comma followed by space."""
-        obj = {"a": 1, "b": 2}
-
-        cpp_sisl = sislc.dumps(obj)
+    def test_spacing(self, exact_format):
+        """One space after each colon, type tag and comma; never more."""
+        cpp_sisl, _ = exact_format["spacing"]
 
-        # Should have comma followed by space
-        assert '", ' in cpp_sisl or '}, ' in cpp_sisl
+        assert ", " in cpp_sisl
+        assert not _SPACING_ERROR_RE.search(cpp_sisl)
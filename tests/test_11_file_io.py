@@ -6,114 +6,110 @@ Tests for --input and --output file path arguments.
 
 import json
 import os
-import tempfile
 import pytest
 
+from _jsonio import json_loads
+
+# Every test here spawns its own sislc process to exercise --input/--output
+pytestmark = pytest.mark.slow
+
+# JSON input payloads, serialized once at import
+_FIXTURES = {
+    "alice": json.dumps({"name": "Alice", "age": 30}),
+    "london": json.dumps({"city": "London", "pop": 9000000}),
+    "abc": json.dumps({"a": "value1", "b": "value2", "c": "value3"}),
+}
+
+
+def _dump_text(path, data):
+    """Write a small text payload with one unbuffered write."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data.encode())
+    finally:
+        os.close(fd)
+
 
 class TestFileInput:
     """Test reading input from a file with --input."""
 
-    def test_dumps_from_json_file(self, sislc):
+    def test_dumps_from_json_file(self, sislc, sample_tmp, request):
         """--dumps --input reads JSON from file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"name": "Alice", "age": 30}, f)
-            f.flush()
-            rc, stdout, stderr = sislc.run_with_files(["--dumps"], input_file=f.name)
-        os.unlink(f.name)
+        in_path = sample_tmp / f"in_{request.node.name}.json"
+        _dump_text(in_path, _FIXTURES["alice"])
+        rc, stdout, stderr = sislc.run_with_files(["--dumps"], input_file=str(in_path))
         assert rc == 0
         result = sislc.loads(stdout.strip())
         assert result == {"name": "Alice", "age": 30}
 
-    def test_dumps_from_xml_file(self, sislc):
+    def test_dumps_from_xml_file(self, sislc, sample_tmp, request):
         """--dumps --xml --input reads XML from file."""
-        xml_content = '<root><name type="str">Bob</name></root>'
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(xml_content)
-            f.flush()
-            rc, stdout, stderr = sislc.run_with_files(
-                ["--dumps", "--xml"], input_file=f.name
-            )
-        os.unlink(f.name)
+        in_path = sample_tmp / f"in_{request.node.name}.xml"
+        _dump_text(in_path, '<root><name type="str">Bob</name></root>')
+        rc, stdout, stderr = sislc.run_with_files(
+            ["--dumps", "--xml"], input_file=str(in_path)
+        )
         assert rc == 0
         result = sislc.loads(stdout.strip())
         assert result == {"name": "Bob"}
 
-    def test_loads_from_sisl_file(self, sislc):
+    def test_loads_from_sisl_file(self, sislc, sample_tmp, request):
         """--loads --input reads SISL from file."""
-        sisl_content = '{name: !str "Alice", age: !int "30"}'
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".sisl", delete=False) as f:
-            f.write(sisl_content)
-            f.flush()
-            rc, stdout, stderr = sislc.run_with_files(["--loads"], input_file=f.name)
-        os.unlink(f.name)
+        in_path = sample_tmp / f"in_{request.node.name}.sisl"
+        _dump_text(in_path, '{name: !str "Alice", age: !int "30"}')
+        rc, stdout, stderr = sislc.run_with_files(["--loads"], input_file=str(in_path))
         assert rc == 0
-        result = json.loads(stdout.strip())
+        result = json_loads(stdout)
         assert result == {"name": "Alice", "age": 30}
 
-    def test_input_file_not_found(self, sislc):
+    def test_input_file_not_found(self, sislc, sample_tmp):
         """--input with nonexistent file produces an error."""
         rc, stdout, stderr = sislc.run_with_files(
-            ["--dumps"], input_file="/tmp/nonexistent_sislc_test_file.json"
+            ["--dumps"], input_file=str(sample_tmp / "nonexistent.json")
         )
         assert rc != 0
-        assert "Cannot open input file" in stderr
+        assert b"Cannot open input file" in stderr
 
 
 class TestFileOutput:
     """Test writing output to a file with --output."""
 
-    def test_dumps_to_file(self, sislc):
+    def test_dumps_to_file(self, sislc, sample_tmp, request):
         """--dumps --output writes SISL to file."""
-        with tempfile.NamedTemporaryFile(suffix=".sisl", delete=False) as f:
-            out_path = f.name
-        try:
-            rc, stdout, stderr = sislc.run_with_files(
-                ["--dumps"], output_file=out_path,
-                stdin_data='{"name": "Alice"}'
-            )
-            assert rc == 0
-            assert stdout == ""  # stdout should be empty
-            with open(out_path) as f:
-                content = f.read().strip()
-            result = sislc.loads(content)
-            assert result == {"name": "Alice"}
-        finally:
-            os.unlink(out_path)
+        out_path = sample_tmp / f"out_{request.node.name}.sisl"
+        rc, stdout, stderr = sislc.run_with_files(
+            ["--dumps"], output_file=str(out_path),
+            stdin_data='{"name": "Alice"}'
+        )
+        assert rc == 0
+        assert stdout == b""  # stdout should be empty
+        result = sislc.loads(out_path.read_text().strip())
+        assert result == {"name": "Alice"}
 
-    def test_loads_to_json_file(self, sislc):
+    def test_loads_to_json_file(self, sislc, sample_tmp, request):
         """--loads --output writes JSON to file."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            out_path = f.name
-        try:
-            rc, stdout, stderr = sislc.run_with_files(
-                ["--loads"], output_file=out_path,
-                stdin_data='{name: !str "Alice", age: !int "30"}'
-            )
-            assert rc == 0
-            assert stdout == ""
-            with open(out_path) as f:
-                result = json.load(f)
-            assert result == {"name": "Alice", "age": 30}
-        finally:
-            os.unlink(out_path)
+        out_path = sample_tmp / f"out_{request.node.name}.json"
+        rc, stdout, stderr = sislc.run_with_files(
+            ["--loads"], output_file=str(out_path),
+            stdin_data='{name: !str "Alice", age: !int "30"}'
+        )
+        assert rc == 0
+        assert stdout == b""
+        result = json_loads(out_path.read_bytes())
+        assert result == {"name": "Alice", "age": 30}
 
-    def test_loads_to_xml_file(self, sislc):
+    def test_loads_to_xml_file(self, sislc, sample_tmp, request):
         """--loads --xml --output writes XML to file."""
-        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as f:
-            out_path = f.name
-        try:
-            rc, stdout, stderr = sislc.run_with_files(
-                ["--loads", "--xml"], output_file=out_path,
-                stdin_data='{name: !str "Alice"}'
-            )
-            assert rc == 0
-            assert stdout == ""
-            with open(out_path) as f:
-                content = f.read()
-            assert "<?xml" in content
-            assert '<name type="str">Alice</name>' in content
-        finally:
-            os.unlink(out_path)
+        out_path = sample_tmp / f"out_{request.node.name}.xml"
+        rc, stdout, stderr = sislc.run_with_files(
+            ["--loads", "--xml"], output_file=str(out_path),
+            stdin_data='{name: !str "Alice"}'
+        )
+        assert rc == 0
+        assert stdout == b""
+        content = out_path.read_text()
+        assert "<?xml" in content
+        assert '<name type="str">Alice</name>' in content
 
     def test_output_file_bad_path(self, sislc):
         """--output with unwritable path produces an error."""
@@ -122,138 +118,90 @@ class TestFileOutput:
             stdin_data='{"x": 1}'
         )
         assert rc != 0
-        assert "Cannot open output file" in stderr
+        assert b"Cannot open output file" in stderr
 
-    def test_output_file_not_created_on_failure(self, sislc):
+    def test_output_file_not_created_on_failure(self, sislc, sample_tmp):
         """--output file is not left behind when processing fails."""
-        with tempfile.NamedTemporaryFile(suffix=".sisl", delete=False) as f:
-            out_path = f.name
-        # Remove so we can check if it gets created
-        os.unlink(out_path)
-        try:
-            rc, stdout, stderr = sislc.run_with_files(
-                ["--dumps"], output_file=out_path,
-                stdin_data="this is not valid json"
-            )
-            assert rc != 0
-            # Output file should not exist (temp was cleaned up on failure)
-            assert not os.path.exists(out_path)
-        finally:
-            if os.path.exists(out_path):
-                os.unlink(out_path)
+        out_path = sample_tmp / "never_created.sisl"
+        rc, stdout, stderr = sislc.run_with_files(
+            ["--dumps"], output_file=str(out_path),
+            stdin_data="this is not valid json"
+        )
+        assert rc != 0
+        # Output file should not exist (temp was cleaned up on failure)
+        assert not out_path.exists()
 
 
 class TestFileInputAndOutput:
     """Test using --input and --output together."""
 
-    def test_dumps_file_to_file(self, sislc):
+    def test_dumps_file_to_file(self, sislc, sample_tmp, request):
         """--dumps --input FILE --output FILE converts file to file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as inf:
-            json.dump({"city": "London", "pop": 9000000}, inf)
-            in_path = inf.name
-        with tempfile.NamedTemporaryFile(suffix=".sisl", delete=False) as outf:
-            out_path = outf.name
-        try:
-            rc, stdout, stderr = sislc.run_with_files(
-                ["--dumps"], input_file=in_path, output_file=out_path
-            )
-            assert rc == 0
-            assert stdout == ""
-            with open(out_path) as f:
-                sisl_content = f.read().strip()
-            result = sislc.loads(sisl_content)
-            assert result == {"city": "London", "pop": 9000000}
-        finally:
-            os.unlink(in_path)
-            os.unlink(out_path)
+        in_path = sample_tmp / f"in_{request.node.name}.json"
+        out_path = sample_tmp / f"out_{request.node.name}.sisl"
+        _dump_text(in_path, _FIXTURES["london"])
+        rc, stdout, stderr = sislc.run_with_files(
+            ["--dumps"], input_file=str(in_path), output_file=str(out_path)
+        )
+        assert rc == 0
+        assert stdout == b""
+        result = sislc.loads(out_path.read_text().strip())
+        assert result == {"city": "London", "pop": 9000000}
 
-    def test_loads_file_to_file(self, sislc):
+    def test_loads_file_to_file(self, sislc, sample_tmp, request):
         """--loads --input FILE --output FILE converts file to file."""
-        sisl_content = '{city: !str "London", pop: !int "9000000"}'
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".sisl", delete=False) as inf:
-            inf.write(sisl_content)
-            in_path = inf.name
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as outf:
-            out_path = outf.name
-        try:
-            rc, stdout, stderr = sislc.run_with_files(
-                ["--loads"], input_file=in_path, output_file=out_path
-            )
-            assert rc == 0
-            with open(out_path) as f:
-                result = json.load(f)
-            assert result == {"city": "London", "pop": 9000000}
-        finally:
-            os.unlink(in_path)
-            os.unlink(out_path)
+        in_path = sample_tmp / f"in_{request.node.name}.sisl"
+        out_path = sample_tmp / f"out_{request.node.name}.json"
+        _dump_text(in_path, '{city: !str "London", pop: !int "9000000"}')
+        rc, stdout, stderr = sislc.run_with_files(
+            ["--loads"], input_file=str(in_path), output_file=str(out_path)
+        )
+        assert rc == 0
+        result = json_loads(out_path.read_bytes())
+        assert result == {"city": "London", "pop": 9000000}
 
-    def test_xml_file_to_sisl_file(self, sislc):
+    def test_xml_file_to_sisl_file(self, sislc, sample_tmp, request):
         """--dumps --xml --input XML --output SISL."""
-        xml_content = '<root><x type="int">42</x></root>'
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as inf:
-            inf.write(xml_content)
-            in_path = inf.name
-        with tempfile.NamedTemporaryFile(suffix=".sisl", delete=False) as outf:
-            out_path = outf.name
-        try:
-            rc, stdout, stderr = sislc.run_with_files(
-                ["--dumps", "--xml"], input_file=in_path, output_file=out_path
-            )
-            assert rc == 0
-            with open(out_path) as f:
-                sisl_content = f.read().strip()
-            result = sislc.loads(sisl_content)
-            assert result == {"x": 42}
-        finally:
-            os.unlink(in_path)
-            os.unlink(out_path)
+        in_path = sample_tmp / f"in_{request.node.name}.xml"
+        out_path = sample_tmp / f"out_{request.node.name}.sisl"
+        _dump_text(in_path, '<root><x type="int">42</x></root>')
+        rc, stdout, stderr = sislc.run_with_files(
+            ["--dumps", "--xml"], input_file=str(in_path), output_file=str(out_path)
+        )
+        assert rc == 0
+        result = sislc.loads(out_path.read_text().strip())
+        assert result == {"x": 42}
 
-    def test_sisl_file_to_xml_file(self, sislc):
+    def test_sisl_file_to_xml_file(self, sislc, sample_tmp, request):
         """--loads --xml --input SISL --output XML."""
-        sisl_content = '{x: !int "42"}'
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".sisl", delete=False) as inf:
-            inf.write(sisl_content)
-            in_path = inf.name
-        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as outf:
-            out_path = outf.name
-        try:
-            rc, stdout, stderr = sislc.run_with_files(
-                ["--loads", "--xml"], input_file=in_path, output_file=out_path
-            )
-            assert rc == 0
-            with open(out_path) as f:
-                content = f.read()
-            assert "<?xml" in content
-            assert '<x type="int">42</x>' in content
-        finally:
-            os.unlink(in_path)
-            os.unlink(out_path)
+        in_path = sample_tmp / f"in_{request.node.name}.sisl"
+        out_path = sample_tmp / f"out_{request.node.name}.xml"
+        _dump_text(in_path, '{x: !int "42"}')
+        rc, stdout, stderr = sislc.run_with_files(
+            ["--loads", "--xml"], input_file=str(in_path), output_file=str(out_path)
+        )
+        assert rc == 0
+        content = out_path.read_text()
+        assert "<?xml" in content
+        assert '<x type="int">42</x>' in content
 
-    def test_split_with_file_output(self, sislc):
+    def test_split_with_file_output(self, sislc, sample_tmp, request):
         """--dumps --max-length --input FILE --output FILE writes split fragments."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as inf:
-            json.dump({"a": "value1", "b": "value2", "c": "value3"}, inf)
-            in_path = inf.name
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as outf:
-            out_path = outf.name
-        try:
-            rc, stdout, stderr = sislc.run_with_files(
-                ["--dumps", "--max-length", "50"],
-                input_file=in_path, output_file=out_path
-            )
-            assert rc == 0
-            with open(out_path) as f:
-                content = f.read().strip()
-            fragments = json.loads(content)
-            assert isinstance(fragments, list)
-            assert len(fragments) >= 2
-            merged = sislc.loads(fragments)
-            assert merged["a"] == "value1"
-            assert merged["b"] == "value2"
-            assert merged["c"] == "value3"
-        finally:
-            os.unlink(in_path)
-            os.unlink(out_path)
+        in_path = sample_tmp / f"in_{request.node.name}.json"
+        out_path = sample_tmp / f"out_{request.node.name}.json"
+        _dump_text(in_path, _FIXTURES["abc"])
+        rc, stdout, stderr = sislc.run_with_files(
+            ["--dumps", "--max-length", "50"],
+            input_file=str(in_path), output_file=str(out_path)
+        )
+        assert rc == 0
+        fragments = json_loads(out_path.read_bytes())
+        assert isinstance(fragments, list)
+        assert len(fragments) >= 2
+        merged = sislc.loads(fragments)
+        assert merged["a"] == "value1"
+        assert merged["b"] == "value2"
+        assert merged["c"] == "value3"
 
 
 class TestFileArgErrors:
@@ -264,7 +212,7 @@ class TestFileArgErrors:
         # Pass --input as a bare flag (no value) via run_with_files args
         rc, stdout, stderr = sislc.run_with_files(["--dumps", "--input"])
         assert rc != 0
-        assert "requires a file path" in stderr
+        assert b"requires a file path" in stderr
 
     def test_output_missing_value(self, sislc):
         """--output without a path produces an error."""
@@ -272,4 +220,4 @@ class TestFileArgErrors:
             ["--dumps", "--output"], stdin_data='{"x": 1}'
         )
         assert rc != 0
-        assert "requires a file path" in stderr
+        assert b"requires a file path" in stderr
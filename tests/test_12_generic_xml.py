@@ -10,10 +10,72 @@ and _children keys.
 """
 
 import json
-import os
-import tempfile
 import pytest
-import xml.etree.ElementTree as ET
+
+
+# (xml_in, expected_tag, expected_text, expected_children): children are
+# (tag, text) pairs, and None means the key must be absent
+BASIC_STRUCTURE_CASES = [
+    pytest.param("<greeting>Hello World</greeting>", "greeting", "Hello World", None,
+                 id="single_text_element"),
+    pytest.param("<empty/>", "empty", None, None, id="empty_element"),
+    pytest.param("<parent><child>text</child></parent>", "parent", None, [("child", "text")],
+                 id="single_child"),
+    pytest.param("<list><a>1</a><b>2</b><c>3</c></list>", "list", None,
+                 [("a", "1"), ("b", "2"), ("c", "3")], id="multiple_children"),
+]
+
+EDGE_NAME_CASES = [
+    pytest.param("<my-root><my-item>text</my-item></my-root>", "my-root", None,
+                 [("my-item", "text")], id="hyphenated"),
+    pytest.param("<com.example.root><com.example.item>text</com.example.item></com.example.root>",
+                 "com.example.root", None, [("com.example.item", "text")], id="dotted"),
+    pytest.param("<_root><__item>text</__item></_root>", "_root", None,
+                 [("__item", "text")], id="underscored"),
+    # Numeric text content stays a string, not coerced to a number
+    pytest.param("<val>42</val>", "val", "42", None, id="numeric_text"),
+]
+
+
+# (xml_in, fragments the encoded SISL must contain)
+PREFIXED_NAMESPACE_CASES = [
+    pytest.param(
+        '<doc xmlns:ns="http://example.com"><ns:item>x</ns:item></doc>',
+        ["xmlns:ns", "http://example.com", "ns:item"],
+        id="single_prefix",
+    ),
+    pytest.param(
+        '<root xmlns:a="http://a.example.com" xmlns:b="http://b.example.com">'
+        '<a:item>X</a:item><b:item>Y</b:item></root>',
+        ["xmlns:a", "xmlns:b", "a:item", "b:item"],
+        id="multiple_prefixes",
+    ),
+]
+
+# Large documents, built and encoded once; dumps_xml sends bytes as-is
+_LONG_TEXT = "A" * 10000
+_LONG_TEXT_XML = f"<doc>{_LONG_TEXT}</doc>".encode()
+_MANY_SIBLINGS_XML = (
+    "<list>" + "".join(f"<item>{i}</item>" for i in range(200)) + "</list>"
+).encode()
+_MANY_ATTRS_XML = (
+    "<item " + " ".join(f'attr{i}="val{i}"' for i in range(20)) + ">content</item>"
+).encode()
+_EXPECTED_SIBLING_TEXTS = [str(i) for i in range(200)]
+_EXPECTED_MANY_ATTRS = {f"attr{i}": f"val{i}" for i in range(20)}
+
+
+def _assert_generic(node, tag, text, children):
+    """Check a generic-mode element's _tag, _text and child (tag, text) pairs."""
+    assert node["_tag"] == tag
+    if text is None:
+        assert "_text" not in node
+    else:
+        assert node["_text"] == text
+    if children is None:
+        assert "_children" not in node
+    else:
+        assert [(c["_tag"], c.get("_text")) for c in node["_children"]] == children
 
 
 class TestGenericXmlDetection:
@@ -48,62 +110,25 @@ class TestGenericXmlDetection:
         obj = {"_root": {"_tag": "doc", "_text": "hello"}}
         sisl_str = sislc.dumps(obj)
         xml_out = sislc.loads_xml(sisl_str)
-        root = ET.fromstring(xml_out)
-        assert root.tag == "doc"
-        assert root.text == "hello"
+        assert "<doc>hello</doc>" in xml_out
 
     def test_json_without_root_key_routes_to_typed(self, sislc):
         """JSON without _root key produces typed XML output."""
         obj = {"name": "Alice"}
         sisl_str = sislc.dumps(obj)
         xml_out = sislc.loads_xml(sisl_str)
-        root = ET.fromstring(xml_out)
-        assert root.tag == "root"
-        assert root.find("name").get("type") == "str"
+        assert "<root>" in xml_out
+        assert '<name type="str">' in xml_out
 
 
 class TestGenericXmlBasicStructures:
     """Test basic element parsing and reconstruction."""
 
-    def test_single_text_element(self, sislc):
-        """Single element with text content."""
-        xml_in = "<greeting>Hello World</greeting>"
-        sisl_out = sislc.dumps_xml(xml_in)
-        result = sislc.loads(sisl_out)
-        assert result["_root"]["_tag"] == "greeting"
-        assert result["_root"]["_text"] == "Hello World"
-
-    def test_empty_element(self, sislc):
-        """Empty self-closing element has no _text or _children."""
-        xml_in = "<empty/>"
-        sisl_out = sislc.dumps_xml(xml_in)
-        result = sislc.loads(sisl_out)
-        root = result["_root"]
-        assert root["_tag"] == "empty"
-        assert "_text" not in root
-        assert "_children" not in root
-
-    def test_element_with_single_child(self, sislc):
-        """Element with one child element."""
-        xml_in = "<parent><child>text</child></parent>"
-        sisl_out = sislc.dumps_xml(xml_in)
-        result = sislc.loads(sisl_out)
-        root = result["_root"]
-        assert root["_tag"] == "parent"
-        assert len(root["_children"]) == 1
-        assert root["_children"][0]["_tag"] == "child"
-        assert root["_children"][0]["_text"] == "text"
-
-    def test_element_with_multiple_children(self, sislc):
-        """Element with several child elements."""
-        xml_in = "<list><a>1</a><b>2</b><c>3</c></list>"
-        sisl_out = sislc.dumps_xml(xml_in)
-        result = sislc.loads(sisl_out)
-        children = result["_root"]["_children"]
-        assert len(children) == 3
-        assert children[0]["_tag"] == "a"
-        assert children[1]["_tag"] == "b"
-        assert children[2]["_tag"] == "c"
+    @pytest.mark.parametrize("xml_in, expected_tag, expected_text, expected_children", BASIC_STRUCTURE_CASES)
+    def test_basic_structure(self, sislc, xml_in, expected_tag, expected_text, expected_children):
+        """Tag, text and child elements are captured for simple documents."""
+        result = sislc.loads(sislc.dumps_xml(xml_in))
+        _assert_generic(result["_root"], expected_tag, expected_text, expected_children)
 
     def test_element_with_attributes(self, sislc):
         """Element attributes are captured in _attrs."""
@@ -239,40 +264,23 @@ class TestGenericXmlNamespaces:
         result = sislc.loads(sisl_out)
         assert result["_root"]["_attrs"]["xmlns"] == "http://example.com"
 
-    def test_prefixed_xmlns_produces_sisl(self, sislc):
-        """xmlns:prefix declarations are encoded to SISL (XML-to-SISL step works)."""
-        xml_in = '<doc xmlns:ns="http://example.com"><ns:item>x</ns:item></doc>'
-        sisl_out = sislc.dumps_xml(xml_in)
-        # The encoder produces SISL containing the namespace data
-        assert "xmlns:ns" in sisl_out
-        assert "http://example.com" in sisl_out
-        assert "ns:item" in sisl_out
-
-    def test_prefixed_xmlns_sisl_round_trip_fails(self, sislc):
-        """Colons in attribute names (xmlns:prefix) break SISL round-trip.
+    @pytest.mark.parametrize("xml_in, expected_fragments", PREFIXED_NAMESPACE_CASES)
+    def test_prefixed_xmlns_breaks_sisl_round_trip(self, sislc, xml_in, expected_fragments):
+        """xmlns:prefix declarations encode to SISL, but the SISL can't be reloaded.
 
         SISL uses ':' as its key-value separator, so JSON keys containing
         colons cannot survive a SISL encode-decode cycle. This affects
         xmlns:prefix declarations and any attribute with a colon in its name.
         """
-        xml_in = '<doc xmlns:ns="http://example.com"><ns:item>x</ns:item></doc>'
         sisl_out = sislc.dumps_xml(xml_in)
+        # The encoder produces SISL containing the namespace data
+        for fragment in expected_fragments:
+            assert fragment in sisl_out
         # Re-loading the SISL string fails because 'xmlns:ns' clashes with
         # SISL's key: !type "value" syntax
         with pytest.raises(RuntimeError, match="--loads failed"):
             sislc.loads(sisl_out)
 
-    def test_multiple_prefixed_namespaces_break_sisl(self, sislc):
-        """Multiple xmlns:prefix declarations also break SISL round-trip."""
-        xml_in = (
-            '<root xmlns:a="http://a.example.com" '
-            'xmlns:b="http://b.example.com">'
-            '<a:item>X</a:item><b:item>Y</b:item></root>'
-        )
-        sisl_out = sislc.dumps_xml(xml_in)
-        with pytest.raises(RuntimeError, match="--loads failed"):
-            sislc.loads(sisl_out)
-
     def test_non_prefixed_namespace_round_trips(self, sislc):
         """Non-prefixed xmlns (no colon) round-trips fine through SISL."""
         xml_in = '<doc xmlns="http://example.com"><item>x</item></doc>'
@@ -332,16 +340,9 @@ class TestGenericXmlSpecialContent:
 
     def test_cdata_normalized_to_text(self, sislc):
         """CDATA sections are normalized to plain text content."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write("<doc><![CDATA[raw content here]]></doc>")
-            f.flush()
-            try:
-                rc, stdout, _ = sislc.run_with_files(["--dumps", "--xml"], input_file=f.name)
-                assert rc == 0
-                loaded = sislc.loads(stdout.strip())
-                assert loaded["_root"]["_text"] == "raw content here"
-            finally:
-                os.unlink(f.name)
+        sisl_out = sislc.dumps_xml("<doc><![CDATA[raw content here]]></doc>")
+        loaded = sislc.loads(sisl_out)
+        assert loaded["_root"]["_text"] == "raw content here"
 
 
 class TestGenericXmlLimitations:
@@ -365,38 +366,24 @@ class TestGenericXmlLimitations:
 
     def test_comments_stripped(self, sislc):
         """XML comments are silently stripped during parsing."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write("<doc><!-- important comment --><item>text</item></doc>")
-            f.flush()
-            try:
-                rc, stdout, _ = sislc.run_with_files(["--dumps", "--xml"], input_file=f.name)
-                assert rc == 0
-                loaded = sislc.loads(stdout.strip())
-                children = loaded["_root"]["_children"]
-                # Only the <item> element survives; comment is gone
-                assert len(children) == 1
-                assert children[0]["_tag"] == "item"
-            finally:
-                os.unlink(f.name)
+        sisl_out = sislc.dumps_xml("<doc><!-- important comment --><item>text</item></doc>")
+        loaded = sislc.loads(sisl_out)
+        children = loaded["_root"]["_children"]
+        # Only the <item> element survives; comment is gone
+        assert len(children) == 1
+        assert children[0]["_tag"] == "item"
 
     def test_processing_instructions_stripped(self, sislc):
         """Processing instructions (other than <?xml?>) are stripped."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write(
-                '<?xml version="1.0"?>'
-                '<?xml-stylesheet type="text/xsl" href="style.xsl"?>'
-                "<doc><item>text</item></doc>"
-            )
-            f.flush()
-            try:
-                rc, stdout, _ = sislc.run_with_files(["--dumps", "--xml"], input_file=f.name)
-                assert rc == 0
-                loaded = sislc.loads(stdout.strip())
-                # Declaration is preserved, PI is not
-                assert "_decl" in loaded
-                assert loaded["_root"]["_tag"] == "doc"
-            finally:
-                os.unlink(f.name)
+        sisl_out = sislc.dumps_xml(
+            '<?xml version="1.0"?>'
+            '<?xml-stylesheet type="text/xsl" href="style.xsl"?>'
+            "<doc><item>text</item></doc>"
+        )
+        loaded = sislc.loads(sisl_out)
+        # Declaration is preserved, PI is not
+        assert "_decl" in loaded
+        assert loaded["_root"]["_tag"] == "doc"
 
     def test_output_uses_tabs_for_indent(self, sislc):
         """Generic XML output uses tab indentation."""
@@ -425,8 +412,7 @@ class TestGenericXmlRoundTrips:
 
     def test_catalog_round_trip(self, sislc):
         """Complex catalog document with attributes and nesting."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-            f.write("""<?xml version="1.0" encoding="UTF-8"?>
+        xml_in = """<?xml version="1.0" encoding="UTF-8"?>
 <catalog>
 \t<book id="1" lang="en">
 \t\t<title>The Great Gatsby</title>
@@ -451,32 +437,15 @@ class TestGenericXmlRoundTrips:
 \t\t</tags>
 \t</book>
 </catalog>
-""")
-            f.flush()
-            try:
-                # Round-trip: XML -> SISL -> XML -> SISL -> JSON
-                rc1, sisl1, _ = sislc.run_with_files(
-                    ["--dumps", "--xml"], input_file=f.name
-                )
-                assert rc1 == 0
-
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".sisl", delete=False
-                ) as sf:
-                    sf.write(sisl1)
-                    sf.flush()
-                    rc2, xml_out, _ = sislc.run_with_files(
-                        ["--loads", "--xml"], input_file=sf.name
-                    )
-                    os.unlink(sf.name)
-                assert rc2 == 0
-
-                # Second round-trip must be stable
-                sisl2 = sislc.dumps_xml(xml_out)
-                xml_out2 = sislc.loads_xml(sisl2)
-                assert xml_out == xml_out2
-            finally:
-                os.unlink(f.name)
+"""
+        # Round-trip: XML -> SISL -> XML -> SISL -> JSON
+        sisl1 = sislc.dumps_xml(xml_in)
+        xml_out = sislc.loads_xml(sisl1)
+
+        # Second round-trip must be stable
+        sisl2 = sislc.dumps_xml(xml_out)
+        xml_out2 = sislc.loads_xml(sisl2)
+        assert xml_out == xml_out2
 
     def test_second_round_trip_is_stable(self, sislc):
         """After first round-trip, subsequent ones produce identical output."""
@@ -490,13 +459,7 @@ class TestGenericXmlRoundTrips:
     <user id="1">admin</user>
   </event>
 </events>"""
-        # First trip
-        sisl1 = sislc.dumps_xml(xml_in)
-        xml1 = sislc.loads_xml(sisl1)
-        # Second trip
-        sisl2 = sislc.dumps_xml(xml1)
-        xml2 = sislc.loads_xml(sisl2)
-        assert xml1 == xml2
+        sislc.assert_idempotent(xml_in)
 
     def test_windows_event_log_structure(self, sislc):
         """Windows Event Log-style XML round-trips structurally."""
@@ -520,7 +483,8 @@ class TestGenericXmlRoundTrips:
 \t</Event>
 </Events>
 """
-        sisl_out = sislc.dumps_xml(xml_in)
+        # Round-trip stability
+        sisl_out = sislc.assert_idempotent(xml_in)
         result = sislc.loads(sisl_out)
 
         # Verify structure
@@ -539,20 +503,11 @@ class TestGenericXmlRoundTrips:
         assert event_data["_tag"] == "EventData"
         assert len(event_data["_children"]) == 2
 
-        # Round-trip stability
-        xml_out = sislc.loads_xml(sisl_out)
-        sisl_out2 = sislc.dumps_xml(xml_out)
-        xml_out2 = sislc.loads_xml(sisl_out2)
-        assert xml_out == xml_out2
-
     def test_many_attributes(self, sislc):
         """Element with many attributes round-trips."""
-        attrs = " ".join(f'attr{i}="val{i}"' for i in range(20))
-        xml_in = f"<item {attrs}>content</item>"
-        sisl_out = sislc.dumps_xml(xml_in)
+        sisl_out = sislc.dumps_xml(_MANY_ATTRS_XML)
         result = sislc.loads(sisl_out)
-        for i in range(20):
-            assert result["_root"]["_attrs"][f"attr{i}"] == f"val{i}"
+        assert result["_root"]["_attrs"] == _EXPECTED_MANY_ATTRS
 
     def test_deeply_nested_with_attributes(self, sislc):
         """Deep nesting where every level has attributes."""
@@ -603,36 +558,11 @@ class TestGenericXmlEdgeCases:
         xml_out2 = sislc.loads_xml(sisl_out2)
         assert xml_out == xml_out2
 
-    def test_hyphenated_tag_names(self, sislc):
-        """Tag names with hyphens."""
-        xml_in = "<my-root><my-item>text</my-item></my-root>"
-        sisl_out = sislc.dumps_xml(xml_in)
-        result = sislc.loads(sisl_out)
-        assert result["_root"]["_tag"] == "my-root"
-        assert result["_root"]["_children"][0]["_tag"] == "my-item"
-
-    def test_dotted_tag_names(self, sislc):
-        """Tag names with dots."""
-        xml_in = "<com.example.root><com.example.item>text</com.example.item></com.example.root>"
-        sisl_out = sislc.dumps_xml(xml_in)
-        result = sislc.loads(sisl_out)
-        assert result["_root"]["_tag"] == "com.example.root"
-
-    def test_underscored_tag_names(self, sislc):
-        """Tag names with underscores."""
-        xml_in = "<_root><__item>text</__item></_root>"
-        sisl_out = sislc.dumps_xml(xml_in)
-        result = sislc.loads(sisl_out)
-        assert result["_root"]["_tag"] == "_root"
-        assert result["_root"]["_children"][0]["_tag"] == "__item"
-
-    def test_numeric_text_stays_string(self, sislc):
-        """Numeric text content stays as a string (not coerced to number)."""
-        xml_in = "<val>42</val>"
-        sisl_out = sislc.dumps_xml(xml_in)
-        result = sislc.loads(sisl_out)
-        assert result["_root"]["_text"] == "42"
-        assert isinstance(result["_root"]["_text"], str)
+    @pytest.mark.parametrize("xml_in, expected_tag, expected_text, expected_children", EDGE_NAME_CASES)
+    def test_unusual_names_and_text(self, sislc, xml_in, expected_tag, expected_text, expected_children):
+        """Unusual tag names and numeric-looking text are kept verbatim."""
+        result = sislc.loads(sislc.dumps_xml(xml_in))
+        _assert_generic(result["_root"], expected_tag, expected_text, expected_children)
 
     def test_whitespace_only_text_is_dropped(self, sislc):
         """Elements with only whitespace text are treated as empty.
@@ -646,26 +576,23 @@ class TestGenericXmlEdgeCases:
         child = result["_root"]["_children"][0]
         assert "_text" not in child
 
-    def test_long_text_content(self, sislc):
+    @pytest.mark.benchmark(group="generic_xml")
+    def test_long_text_content(self, sislc, benchmark):
         """Very long text content survives round-trip."""
-        long_text = "A" * 10000
-        xml_in = f"<doc>{long_text}</doc>"
-        sisl_out = sislc.dumps_xml(xml_in)
-        xml_out = sislc.loads_xml(sisl_out)
-        sisl_out2 = sislc.dumps_xml(xml_out)
-        result = sislc.loads(sisl_out2)
-        assert result["_root"]["_text"] == long_text
+        def round_trip():
+            sisl_out = sislc.dumps_xml(_LONG_TEXT_XML, cache=False)
+            xml_out = sislc.loads_xml(sisl_out)
+            return sislc.loads(sislc.dumps_xml(xml_out, cache=False))
 
-    def test_many_siblings(self, sislc):
+        result = benchmark(round_trip)
+        assert result["_root"]["_text"] == _LONG_TEXT
+
+    @pytest.mark.benchmark(group="generic_xml")
+    def test_many_siblings(self, sislc, benchmark):
         """Large number of sibling elements."""
-        items = "".join(f"<item>{i}</item>" for i in range(200))
-        xml_in = f"<list>{items}</list>"
-        sisl_out = sislc.dumps_xml(xml_in)
-        result = sislc.loads(sisl_out)
+        result = benchmark(lambda: sislc.loads(sislc.dumps_xml(_MANY_SIBLINGS_XML, cache=False)))
         children = result["_root"]["_children"]
-        assert len(children) == 200
-        assert children[0]["_text"] == "0"
-        assert children[199]["_text"] == "199"
+        assert [c["_text"] for c in children] == _EXPECTED_SIBLING_TEXTS
 
     def test_attribute_order_preserved(self, sislc):
         """Attribute order is preserved through round-trip."""
@@ -673,7 +600,5 @@ class TestGenericXmlEdgeCases:
         sisl_out = sislc.dumps_xml(xml_in)
         xml_out = sislc.loads_xml(sisl_out)
         # Check that attributes appear in the output
-        root = ET.fromstring(xml_out)
-        assert root.get("z") == "3"
-        assert root.get("a") == "1"
-        assert root.get("m") == "2"
+        for key, value in (("z", "3"), ("a", "1"), ("m", "2")):
+            assert f'{key}="{value}"' in xml_out